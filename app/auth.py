@@ -3,8 +3,9 @@ Authentication utilities and Supabase client
 """
 
 from fastapi import Request, HTTPException, status
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 from typing import Optional
+import httpx
 import os
 
 # Initialize Supabase client
@@ -15,12 +16,25 @@ SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
 if not SUPABASE_URL or not SUPABASE_ANON_KEY:
     raise ValueError("Missing Supabase credentials in environment")
 
+# HTTP session behind both supabase clients. supabase-py's default one drops
+# idle connections after 5s, so most page views paid a fresh TLS handshake;
+# this keeps them for a minute. Requests carry their own URL and auth headers,
+# so the anon and admin clients can share it.
+_supabase_http = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0),
+    timeout=120.0,
+    follow_redirects=True,
+)
+
 # Main client for regular operations (with RLS)
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+supabase: Client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY, ClientOptions(httpx_client=_supabase_http))
 
 # Admin client for bypassing RLS (use sparingly, only for signup profile creation)
-supabase_admin: Optional[Client] = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY) if SUPABASE_SERVICE_KEY else None
-
+supabase_admin: Optional[Client] = (
+    create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY, ClientOptions(httpx_client=_supabase_http))
+    if SUPABASE_SERVICE_KEY else None
+)
 
 async def get_current_user(request: Request):
     """
@@ -5,32 +5,59 @@ Multi-user with Supabase authentication
 
 from fastapi import FastAPI, Request, Depends, HTTPException, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from app.auth import get_current_user, supabase
+from app.responses import ORJSONResponse
+from app.sessions import RedisSessionMiddleware
+from app.staticfiles import CachedStaticFiles
+from app.utils.cache import get_redis
 from app.routes import auth, dashboard, jobs, search, resume
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release pooled Redis connections on shutdown
+    if get_redis() is not None:
+        await get_redis().aclose()
+
+
 # App initialization
 app = FastAPI(
     title="Zephyr Job Tracker",
     description="Automated job application tracking with LinkedIn scraping",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-# Session middleware for cookie-based auth
-SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production")
-app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY)
+# Session middleware: Redis-backed when REDIS_URL is set, otherwise
+# Starlette's signed-cookie sessions
+redis = get_redis()
+if redis is not None:
+    app.add_middleware(RedisSessionMiddleware, redis=redis)
+else:
+    SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production")
+    app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY)
+
+# Compress HTML/JSON responses. Added last so it is the outermost middleware
+# and wraps every response, including session cookie writes.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-# Templates and static files
+# Templates and static files (one shared Jinja environment, also reachable
+# as request.app.state.templates)
 BASE_DIR = Path(__file__).resolve().parent
 from app.templating import templates
+app.state.templates = templates
 
-# Mount static files (CSS, JS, images)
-app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
+# Mount static files (CSS, JS, images). Set SERVE_STATIC=0 when a reverse
+# proxy/CDN serves /static directly so those hits never reach Python.
+if os.getenv("SERVE_STATIC", "1") != "0":
+    app.mount("/static", CachedStaticFiles(directory=str(BASE_DIR / "static")), name="static")
 
 # Include routers
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
@@ -0,0 +1,20 @@
+"""
+Shared response classes.
+
+`ORJSONResponse` serializes with orjson, which writes UTF-8 bytes in one
+pass instead of stdlib `json.dumps` → str → `.encode()`. Defined here rather
+than imported from fastapi.responses because newer FastAPI releases
+deprecate their copy.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
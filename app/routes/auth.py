@@ -5,8 +5,6 @@ Authentication routes - Login, Signup, Logout, Password reset
 import os
 from fastapi import APIRouter, Request, Form, HTTPException, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
 
 from app.auth import supabase, supabase_admin, SUPABASE_URL, SUPABASE_ANON_KEY
 
@@ -39,13 +37,15 @@ async def login(
             "password": password
         })
         
-        # Store user in session
+        # Store only what the app reads back — the session travels with every
+        # request (cookie or Redis), so keep it small. The access token and
+        # full user_metadata blob are never used server-side.
+        metadata = response.user.user_metadata or {}
         request.session["user"] = {
             "id": response.user.id,
             "email": response.user.email,
-            "user_metadata": response.user.user_metadata
+            "username": metadata.get("username") or response.user.email.split("@")[0],
         }
-        request.session["access_token"] = response.session.access_token
         
         return RedirectResponse(url="/dashboard", status_code=status.HTTP_303_SEE_OTHER)
         
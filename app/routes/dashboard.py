@@ -2,33 +2,52 @@
 Dashboard routes
 """
 
+import asyncio
+import bisect
 from fastapi import APIRouter, Request, Depends
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
-from datetime import datetime, timedelta
+from fastapi.responses import HTMLResponse, Response
+from datetime import date, datetime, timedelta
+from typing import Optional
 
 from app.auth import get_current_user, supabase
+from app.routes.jobs import status_counts, status_stats
+from app.utils.cache import (
+    PAGE_CACHE_CONTROL,
+    cache_get_json,
+    cache_set_json,
+    dashboard_cache_key,
+    etag_matches,
+    page_etag,
+)
 from app.utils.cleanup import cleanup_total_for_user
 
 router = APIRouter()
 
+DASHBOARD_CACHE_TTL_SEC = 45
+
 from app.templating import templates
 
 
+# Applied-count needed to reach each level (index 0 → level 1)
+THRESHOLDS = (0, 5, 10, 20, 35, 50, 75, 100, 150, 200)
+
+_ONE_DAY = timedelta(days=1)
+_ONE_WEEK = timedelta(days=7)
+
+# What the "Recent applications" rows render
+_RECENT_COLUMNS = "id,title,company,location,url,applied_at,created_at,ai_summary,ai_requirements,description"
+# dashboard.html shows this much of a description; one extra character keeps
+# its "…" check working once the rest is trimmed off the cached context
+RECENT_DESCRIPTION_CHARS = 600
+
+
 def calculate_level(applied_count: int) -> tuple:
     """Calculate user level and XP progress based on applied jobs"""
-    # Level thresholds
-    thresholds = [0, 5, 10, 20, 35, 50, 75, 100, 150, 200]
-    level = 1
-
-    for i, threshold in enumerate(thresholds):
-        if applied_count >= threshold:
-            level = i + 1
+    level = bisect.bisect_right(THRESHOLDS, applied_count)
 
     # Calculate XP for next level
-    next_threshold = thresholds[level] if level < len(thresholds) else thresholds[-1] + 50
-    current_threshold = thresholds[level - 1]
+    next_threshold = THRESHOLDS[level] if level < len(THRESHOLDS) else THRESHOLDS[-1] + 50
+    current_threshold = THRESHOLDS[level - 1]
     xp_in_level = applied_count - current_threshold
     xp_needed = next_threshold - current_threshold
     xp_progress = int((xp_in_level / xp_needed) * 100) if xp_needed > 0 else 100
@@ -36,114 +55,197 @@ def calculate_level(applied_count: int) -> tuple:
     return level, xp_progress
 
 
+def calculate_streak(applied_jobs: list, today: Optional[date] = None) -> int:
+    """Consecutive days with at least one application, ending today or yesterday."""
+    # Use applied_at if available, otherwise fallback to created_at
+    dates = set()
+    for job in applied_jobs:
+        stamp = job.get("applied_at") or job.get("created_at")
+        if stamp:
+            dates.add(date.fromisoformat(stamp[:10]))
+
+    cur = today or date.today()
+    if cur not in dates:
+        cur -= _ONE_DAY
+    streak = 0
+    while cur in dates:
+        streak += 1
+        cur -= _ONE_DAY
+    return streak
+
+
+def _count_jobs(query) -> int:
+    """Exact row count for a jobs query, without fetching any rows."""
+    return query.execute().count or 0
+
+
+def _fetch_week_count(user_id: str, week_ago: str) -> int:
+    return _count_jobs(
+        supabase.table("jobs").select("id", count="exact", head=True)
+        .eq("user_id", user_id)
+        .gte("created_at", week_ago)
+    )
+
+
+def _fetch_scored_count(user_id: str) -> int:
+    """Non-applied jobs that have a match score (0 means AI scoring is off)."""
+    return _count_jobs(
+        supabase.table("jobs").select("id", count="exact", head=True)
+        .eq("user_id", user_id)
+        .or_("status.is.null,status.neq.Applied")
+        .not_.is_("match_score", "null")
+    )
+
+
+def _fetch_applied_stamps(user_id: str) -> list:
+    """Applied jobs' dates for the streak, newest first. PostgREST caps a
+    response at max-rows, so if anything is cut it's the oldest applications,
+    which a current streak never reaches."""
+    return (
+        supabase.table("jobs")
+        .select("applied_at,created_at")
+        .eq("user_id", user_id)
+        .eq("status", "Applied")
+        .order("applied_at", desc=True, nullsfirst=False)
+        .execute()
+    ).data or []
+
+
+def _fetch_recent_applied(user_id: str):
+    """Last 10 Applied jobs, newest application first."""
+    return (
+        supabase.table("jobs")
+        .select(_RECENT_COLUMNS)
+        .eq("user_id", user_id)
+        .eq("status", "Applied")
+        .order("applied_at", desc=True, nullsfirst=False)
+        .order("created_at", desc=True)
+        .limit(10)
+        .execute()
+    )
+
+
+def _fetch_cleanup_count(user_id: str) -> int:
+    """Stale-job cleanup count (last 30 days); 0 if the log is unavailable."""
+    try:
+        return cleanup_total_for_user(supabase, user_id, days=30)
+    except Exception:
+        return 0
+
+
+def _fetch_active_searches(user_id: str) -> int:
+    """How many of the user's search configs are switched on."""
+    resp = supabase.table("search_configs").select("is_active").eq("user_id", user_id).execute()
+    return sum(1 for c in (resp.data or []) if c.get("is_active"))
+
+
+def _fetch_has_resume(user_id: str) -> bool:
+    try:
+        profile_resp = supabase.table("profiles").select("resume_text").eq("id", user_id).single().execute()
+        return bool((profile_resp.data or {}).get("resume_text"))
+    except Exception:
+        return False
+
+
+async def _build_dashboard_context(user: dict) -> dict:
+    """Everything dashboard.html needs besides the user itself."""
+    # The Supabase reads are independent — run them concurrently
+    # (the supabase client is sync, so those calls go to worker threads).
+    uid = user["id"]
+    week_ago = (datetime.now() - _ONE_WEEK).isoformat()
+    # Counts come from Postgres (the RPC and count="exact" heads), never from
+    # a row list that max-rows could truncate.
+    (
+        counts,
+        week_count,
+        scored_count,
+        applied_jobs,
+        recent_response,
+        active_searches,
+        cleanup_count_30d,
+        has_resume,
+    ) = await asyncio.gather(
+        asyncio.to_thread(status_counts, uid),
+        asyncio.to_thread(_fetch_week_count, uid, week_ago),
+        asyncio.to_thread(_fetch_scored_count, uid),
+        asyncio.to_thread(_fetch_applied_stamps, uid),
+        asyncio.to_thread(_fetch_recent_applied, uid),
+        asyncio.to_thread(_fetch_active_searches, uid),
+        asyncio.to_thread(_fetch_cleanup_count, uid),
+        asyncio.to_thread(_fetch_has_resume, uid),
+    )
+
+    total_jobs = sum(counts.values())
+    applied_count = counts["Applied"]
+
+    # Recent applications (last 10) - Only Applied jobs, sorted by applied date
+    sorted_jobs = recent_response.data or []
+    for job in sorted_jobs:
+        if job.get("description"):
+            job["description"] = job["description"][:RECENT_DESCRIPTION_CHARS + 1]
+
+    # Gamification - Calculate level and XP
+    user_level, xp_progress = calculate_level(applied_count)
+
+    # Streak calculation - use applied_at for accurate tracking
+    user_streak = calculate_streak(applied_jobs)
+
+    username = user.get("username") or user.get("email", "").split("@")[0]
+
+    # Onboarding state: is the user fully set up?
+    has_search = active_searches > 0
+    has_jobs = total_jobs > 0
+    is_onboarding = not (has_resume and has_search and has_jobs)
+
+    # "AI features paused" hint: no non-applied job has a match_score, so scoring is offline.
+    ai_paused = total_jobs > 0 and scored_count == 0
+
+    return {
+        "username": username,
+        "stats": {
+            "total": total_jobs,
+            **status_stats(counts),
+            "active_searches": active_searches,
+            "week": week_count
+        },
+        "recent_jobs": sorted_jobs,
+        "user_level": user_level,
+        "xp_progress": xp_progress,
+        "user_streak": user_streak,
+        "cleanup_count_30d": cleanup_count_30d,
+        "onboarding": {
+            "active": is_onboarding,
+            "has_resume": has_resume,
+            "has_search": has_search,
+            "has_jobs": has_jobs,
+        },
+        "ai_paused": ai_paused,
+    }
+
+
 @router.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request, user = Depends(get_current_user)):
     """Main dashboard view with stats"""
 
-    try:
-        # Fetch user's jobs
-        jobs_response = supabase.table("jobs").select("*").eq("user_id", user["id"]).execute()
-        jobs = jobs_response.data or []
-
-        # Fetch search configs
-        configs_response = supabase.table("search_configs").select("*").eq("user_id", user["id"]).execute()
-        configs = configs_response.data or []
-
-        # Calculate stats
-        total_jobs = len(jobs)
-        applied_count = len([j for j in jobs if j.get("status") == "Applied"])
-        thinking_count = len([j for j in jobs if j.get("status") == "Thinking"])
-        ignored_count = len([j for j in jobs if j.get("status") == "Ignored"])
-        new_count = len([j for j in jobs if j.get("status") == "New" or not j.get("status")])
-        active_searches = len([c for c in configs if c.get("is_active")])
-
-        # Jobs this week
-        week_ago = (datetime.now() - timedelta(days=7)).isoformat()
-        recent_jobs = [j for j in jobs if j.get("created_at", "") >= week_ago]
-        week_count = len(recent_jobs)
-
-        # Recent applications (last 10) - Only Applied jobs, sorted by applied date
-        applied_jobs = [j for j in jobs if j.get("status") == "Applied"]
-        sorted_jobs = sorted(applied_jobs, key=lambda x: x.get("applied_at", x.get("created_at", "")), reverse=True)[:10]
-
-        # Gamification - Calculate level and XP
-        user_level, xp_progress = calculate_level(applied_count)
-
-        # Streak calculation - use applied_at for accurate tracking
-        user_streak = 0
-        if applied_count > 0:
-            # Count consecutive days with applications using applied_at
-            dates_with_applications = set()
-            for job in jobs:
-                if job.get("status") == "Applied":
-                    # Use applied_at if available, otherwise fallback to created_at
-                    date = job.get("applied_at", job.get("created_at", ""))[:10]
-                    if date:
-                        dates_with_applications.add(date)
-
-            if dates_with_applications:
-                sorted_dates = sorted(dates_with_applications, reverse=True)
-                today = datetime.now().date().isoformat()
-
-                # Check if user applied today or yesterday
-                if sorted_dates[0] == today or sorted_dates[0] == (datetime.now() - timedelta(days=1)).date().isoformat():
-                    streak = 1
-                    check_date = datetime.fromisoformat(sorted_dates[0])
-                    for i in range(1, len(sorted_dates)):
-                        prev_date = (check_date - timedelta(days=i)).date().isoformat()
-                        if prev_date in sorted_dates:
-                            streak += 1
-                        else:
-                            break
-                    user_streak = streak
-
-        # Get username from user metadata
-        username = user.get("user_metadata", {}).get("username", user.get("email", "").split("@")[0])
-
-        # Stale-job cleanup count (last 30 days)
-        try:
-            cleanup_count_30d = cleanup_total_for_user(supabase, user["id"], days=30)
-        except Exception:
-            cleanup_count_30d = 0
-
-        # Onboarding state: is the user fully set up?
-        try:
-            profile_resp = supabase.table("profiles").select("resume_text").eq("id", user["id"]).single().execute()
-            has_resume = bool((profile_resp.data or {}).get("resume_text"))
-        except Exception:
-            has_resume = False
-        has_search = active_searches > 0
-        has_jobs = total_jobs > 0
-        is_onboarding = not (has_resume and has_search and has_jobs)
-
-        # "AI features paused" hint: if any non-applied job lacks match_score, scoring is offline.
-        ai_paused = bool(jobs) and all(j.get("match_score") is None for j in jobs if j.get("status") != "Applied")
+    # Browser already has this version of the page → 304, no queries/render.
+    etag = await page_etag(user["id"], templates.env.globals["asset_v"])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": PAGE_CACHE_CONTROL})
 
-        return templates.TemplateResponse(request, "dashboard.html", {
-            "user": user,
-            "username": username,
-            "stats": {
-                "total": total_jobs,
-                "applied": applied_count,
-                "thinking": thinking_count,
-                "ignored": ignored_count,
-                "new": new_count,
-                "active_searches": active_searches,
-                "week": week_count
-            },
-            "recent_jobs": sorted_jobs,
-            "user_level": user_level,
-            "xp_progress": xp_progress,
-            "user_streak": user_streak,
-            "cleanup_count_30d": cleanup_count_30d,
-            "onboarding": {
-                "active": is_onboarding,
-                "has_resume": has_resume,
-                "has_search": has_search,
-                "has_jobs": has_jobs,
-            },
-            "ai_paused": ai_paused,
-        })
+    try:
+        # Stats only change when the user's jobs/configs do; serve a cached
+        # copy for a short window (invalidated on writes, see utils/cache.py).
+        cache_key = dashboard_cache_key(user["id"])
+        context = await cache_get_json(cache_key)
+        if context is None:
+            context = await _build_dashboard_context(user)
+            await cache_set_json(cache_key, context, ttl=DASHBOARD_CACHE_TTL_SEC)
+
+        response = templates.TemplateResponse(request, "dashboard.html", {"user": user, **context})
+        if etag:
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = PAGE_CACHE_CONTROL
+        return response
 
     except Exception as e:
         return templates.TemplateResponse(request, "dashboard.html", {
@@ -6,14 +6,23 @@ import os
 import asyncio
 import time
 import logging
+from collections import Counter
 from fastapi import APIRouter, Request, Depends, Form, Query, BackgroundTasks
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from datetime import datetime
 from dotenv import load_dotenv
 
 from app.auth import get_current_user, supabase
+from app.responses import ORJSONResponse
+from app.utils.cache import (
+    PAGE_CACHE_CONTROL,
+    board_cache_key,
+    cache_get_json,
+    cache_set_json,
+    etag_matches,
+    invalidate_user_pages,
+    page_etag,
+)
 
 load_dotenv()
 
@@ -27,7 +36,12 @@ _SCRAPE_COOLDOWN_SEC = 300  # 5 minutes between runs
 
 
 async def _run_scraper_inline(triggered_by_user_id: str):
-    """Run scraper.main() in the same process. Set running flag for the UI."""
+    """Run scraper.main() in the same process. Set running flag for the UI.
+
+    The scraper makes blocking Supabase and LLM calls, so it gets its own
+    event loop on a worker thread instead of stalling the one serving
+    requests for the whole run.
+    """
     import sys as _sys
     from pathlib import Path as _Path
     _root = str(_Path(__file__).resolve().parent.parent.parent)
@@ -38,26 +52,69 @@ async def _run_scraper_inline(triggered_by_user_id: str):
     _SCRAPE_STATE["last_started_at"] = time.time()
     _SCRAPE_STATE["started_by"] = triggered_by_user_id
     try:
-        await _scraper.main()
+        await asyncio.to_thread(_scraper.run)
     except Exception:
         logger.exception("Inline scraper run failed")
     finally:
         _SCRAPE_STATE["running"] = False
+        await invalidate_user_pages(triggered_by_user_id)
 
 from app.templating import templates
 
 
 
-_SORT_KEYS = {
-    "match":   lambda j: (-(j.get("match_score") or -1), j.get("created_at", "")),
-    "date":    lambda j: (-(_iso_rank(j.get("created_at"))),),
-    "company": lambda j: ((j.get("company") or "").lower(), j.get("title") or ""),
+# ORDER BY terms per sort option, applied in Postgres; every sort ends with
+# newest-first so ties keep the "date" order. Unscored jobs sort last.
+_SORT_ORDERS = {
+    "date":    (("created_at", {"desc": True}),),
+    "match":   (("match_score", {"desc": True, "nullsfirst": False}),
+                ("created_at", {"desc": True})),
+    "company": (("company", {}), ("title", {}), ("created_at", {"desc": True})),
 }
 
 
-def _iso_rank(s):
-    """Big number that sorts newest-first when negated."""
-    return int((s or "0").replace("-", "").replace(":", "").replace("T", "").replace(".", "")[:14] or 0)
+# Only the columns jobs.html renders — skips the rest of the row on the wire.
+_LIST_COLUMNS = (
+    "id,title,company,location,url,status,created_at,posted_date,"
+    "work_type,description_snippet,ai_requirements,match_score,match_reasoning"
+)
+# The expanded panel's fields, fetched per job when a row is first opened
+# (job_detail.html) so the long text stays out of the board query
+_DETAIL_COLUMNS = (
+    "id,created_at,posted_date,job_type,experience_level,work_type,"
+    "description,ai_summary,ai_requirements,match_score,match_reasoning"
+)
+
+
+# Job statuses in display order; stats dicts are keyed by their lowercase name.
+STATUS_ORDER = ("Applied", "Thinking", "Ignored", "New")
+
+# Job rows per board page; the rest are one Postgres range away.
+PAGE_SIZE = 50
+BOARD_CACHE_TTL_SEC = 30
+
+
+def status_stats(counts: Counter) -> dict:
+    """{"applied": n, "thinking": n, ...} for the templates' stat cards."""
+    return {s.lower(): counts[s] for s in STATUS_ORDER}
+
+
+def board_count(counts: Counter, status_filter: str = None) -> int:
+    """Jobs the board lists under `status_filter` (Applied is never listed)."""
+    if status_filter and status_filter != "all":
+        return counts[status_filter]
+    return sum(counts.values()) - counts["Applied"]
+
+
+def page_count(total: int) -> int:
+    """Board pages for `total` jobs (at least one, even when empty)."""
+    return max(1, -(-total // PAGE_SIZE))
+
+
+def status_counts(user_id: str) -> Counter:
+    """Per-status job counts, grouped in Postgres (jobs_status_counts RPC)."""
+    resp = supabase.rpc("jobs_status_counts", {"uid": user_id}).execute()
+    return Counter({row["status"]: row["n"] for row in (resp.data or [])})
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -66,43 +123,79 @@ async def list_jobs(
     user = Depends(get_current_user),
     status_filter: str = Query(None),
     sort: str = Query("date"),
+    page: int = Query(1, ge=1),
 ):
-    """View all job applications"""
+    """View all job applications, PAGE_SIZE rows at a time"""
 
-    try:
-        response = supabase.table("jobs").select("*").eq("user_id", user["id"]).execute()
-        all_jobs = response.data or []
-
-        # Non-applied jobs (Applied lives on dashboard)
-        jobs = [j for j in all_jobs if j.get("status") != "Applied"]
+    etag = await page_etag(user["id"], templates.env.globals["asset_v"], request.url.query)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": PAGE_CACHE_CONTROL})
 
+    try:
+        # Non-applied jobs (Applied lives on dashboard), filtered and sorted
+        # in Postgres
+        query = (
+            supabase.table("jobs")
+            .select(_LIST_COLUMNS)
+            .eq("user_id", user["id"])
+            .or_("status.is.null,status.neq.Applied")
+        )
         if status_filter and status_filter != "all":
-            jobs = [j for j in jobs if j.get("status") == status_filter]
-
-        sort_key = _SORT_KEYS.get(sort, _SORT_KEYS["date"])
-        jobs = sorted(jobs, key=sort_key)
-
-        return templates.TemplateResponse(request, "jobs.html", {
+            query = query.eq("status", status_filter)
+        for column, options in _SORT_ORDERS.get(sort, _SORT_ORDERS["date"]):
+            query = query.order(column, **options)
+        offset = (page - 1) * PAGE_SIZE
+        query = query.range(offset, offset + PAGE_SIZE - 1)
+
+        # A browser that misses the 304 (another tab, back from another
+        # filter) still gets this exact page from Redis for a short window.
+        cache_key = board_cache_key(user["id"], etag) if etag else None
+        cached = await cache_get_json(cache_key) if cache_key else None
+        if cached is not None:
+            jobs, counts = cached["jobs"], Counter(cached["counts"])
+        else:
+            jobs_response, counts = await asyncio.gather(
+                asyncio.to_thread(query.execute),
+                asyncio.to_thread(status_counts, user["id"]),
+            )
+            jobs = jobs_response.data or []
+            if cache_key:
+                await cache_set_json(cache_key, {"jobs": jobs, "counts": counts}, ttl=BOARD_CACHE_TTL_SEC)
+        to_review = board_count(counts, status_filter)
+
+        response = templates.TemplateResponse(request, "jobs.html", {
             "user": user,
             "jobs": jobs,
             "status_filter": status_filter,
             "sort": sort,
-            "stats": {
-                "total": len(all_jobs),
-                "applied": len([j for j in all_jobs if j.get("status") == "Applied"]),
-                "thinking": len([j for j in all_jobs if j.get("status") == "Thinking"]),
-                "ignored": len([j for j in all_jobs if j.get("status") == "Ignored"]),
-                "new": len([j for j in all_jobs if j.get("status") != "Applied" and (j.get("status") == "New" or not j.get("status"))]),
-            },
+            "to_review": to_review,
+            "page": page,
+            "page_count": page_count(to_review),
+            "page_size": PAGE_SIZE,
+            "stats": {"total": sum(counts.values()), **status_stats(counts)},
         })
+        if etag:
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = PAGE_CACHE_CONTROL
+        return response
 
     except Exception as e:
         return templates.TemplateResponse(request, "jobs.html", {
             "user": user,
+            "jobs": [],
+            "stats": {"total": 0, **status_stats(Counter())},
             "error": f"Error loading jobs: {str(e)}",
         })
 
 
+def _status_updated(request: Request, status: str):
+    """JSON for the board's in-place fetch() updates; a redirect back to the
+    board for plain form posts."""
+    if "application/json" in request.headers.get("accept", ""):
+        return ORJSONResponse({"status": status})
+    return RedirectResponse(url="/job-board", status_code=303)
+
+
 @router.post("/{job_id}/update-status")
 async def update_job_status(
     request: Request,
@@ -115,8 +208,10 @@ async def update_job_status(
     try:
         # Ignored = hard delete immediately (user explicitly rejected)
         if status == "Ignored":
-            supabase.table("jobs").delete().eq("id", job_id).eq("user_id", user["id"]).execute()
-            return RedirectResponse(url="/job-board", status_code=303)
+            query = supabase.table("jobs").delete().eq("id", job_id).eq("user_id", user["id"])
+            await asyncio.to_thread(query.execute)
+            await invalidate_user_pages(user["id"])
+            return _status_updated(request, status)
 
         # Build update data
         update_data = {"status": status, "last_viewed_at": datetime.utcnow().isoformat()}
@@ -125,19 +220,38 @@ async def update_job_status(
         if status == "Applied":
             update_data["applied_at"] = datetime.utcnow().isoformat()
 
-        supabase.table("jobs").update(update_data).eq("id", job_id).eq("user_id", user["id"]).execute()
-        return RedirectResponse(url="/job-board", status_code=303)
+        query = supabase.table("jobs").update(update_data).eq("id", job_id).eq("user_id", user["id"])
+        await asyncio.to_thread(query.execute)
+        await invalidate_user_pages(user["id"])
+        return _status_updated(request, status)
 
     except Exception as e:
-        return {"error": str(e)}
+        return ORJSONResponse({"error": str(e)})
+
+
+@router.get("/{job_id}/detail", response_class=HTMLResponse)
+async def job_detail(request: Request, job_id: int, user=Depends(get_current_user)):
+    """The expanded panel for one job on the board."""
+    query = (
+        supabase.table("jobs")
+        .select(_DETAIL_COLUMNS)
+        .eq("id", job_id)
+        .eq("user_id", user["id"])
+        .maybe_single()
+    )
+    resp = await asyncio.to_thread(query.execute)
+    if not resp or not resp.data:
+        return Response(status_code=404)
+    return templates.TemplateResponse(request, "job_detail.html", {"job": resp.data})
 
 
 @router.post("/{job_id}/view")
 async def mark_job_viewed(job_id: int, user=Depends(get_current_user)):
     """Lightweight ping that records the user expanded/viewed this job."""
-    supabase.table("jobs").update({
+    query = supabase.table("jobs").update({
         "last_viewed_at": datetime.utcnow().isoformat(),
-    }).eq("id", job_id).eq("user_id", user["id"]).execute()
+    }).eq("id", job_id).eq("user_id", user["id"])
+    await asyncio.to_thread(query.execute)
     return {"ok": True}
 
 
@@ -146,6 +260,7 @@ async def trigger_cleanup(user=Depends(get_current_user)):
     """Manually trigger stale-job cleanup for the current user."""
     from app.utils.cleanup import cleanup_stale_jobs
     result = cleanup_stale_jobs(supabase, user_id=user["id"])
+    await invalidate_user_pages(user["id"])
     return result
 
 
@@ -163,19 +278,22 @@ async def scrape_status(user=Depends(get_current_user)):
 async def scrape_now(background_tasks: BackgroundTasks, user=Depends(get_current_user)):
     """Kick off scraper.main() as a background task. One run at a time."""
     if _SCRAPE_STATE["running"]:
-        return JSONResponse(
+        return ORJSONResponse(
             {"started": False, "reason": "Scraper already running. Check back in a few minutes."},
             status_code=409,
         )
     elapsed = time.time() - _SCRAPE_STATE["last_started_at"]
     if elapsed < _SCRAPE_COOLDOWN_SEC:
         wait = int(_SCRAPE_COOLDOWN_SEC - elapsed)
-        return JSONResponse(
+        return ORJSONResponse(
             {"started": False, "reason": f"Just ran. Try again in {wait // 60}m {wait % 60}s."},
             status_code=429,
         )
     background_tasks.add_task(_run_scraper_inline, user["id"])
-    return {"started": True, "message": "Scraper started. Refresh in 5-15 minutes."}
+    return ORJSONResponse(
+        {"started": True, "message": "Scraper started. Refresh in 5-15 minutes."},
+        status_code=202,
+    )
 
 
 # Note: on-demand fetch-description was removed. Descriptions are fetched
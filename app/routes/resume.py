@@ -2,11 +2,11 @@ import asyncio
 import logging
 
 from fastapi import APIRouter, Request, Depends, UploadFile, File, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
+from fastapi.responses import HTMLResponse, RedirectResponse
 
 from app.auth import get_current_user, supabase
+from app.responses import ORJSONResponse
+from app.utils.cache import invalidate_user_pages
 from app.utils.resume_parser import parse_resume
 
 from app.templating import templates
@@ -15,6 +15,7 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 _MAX_BYTES = 5 * 1024 * 1024  # 5 MB
+RESCORE_CONCURRENCY = 4  # simultaneous LLM calls per rescore request
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -55,6 +56,7 @@ async def upload_resume(
         "resume_text": resume_text,
         "resume_filename": file.filename,
     }).execute()
+    await invalidate_user_pages(user["id"])
 
     return RedirectResponse(url="/resume/?uploaded=1", status_code=303)
 
@@ -67,32 +69,41 @@ async def rescore_all_jobs(
     """Re-score all jobs that don't have a match_score yet."""
     from app.utils.ai_client import score_job_match
 
-    profile = supabase.table("profiles").select("resume_text").eq("id", user["id"]).single().execute()
-    resume_text = (profile.data or {}).get("resume_text") or ""
-    if not resume_text:
-        return JSONResponse({"error": "No resume uploaded"}, status_code=400)
-
-    jobs_resp = (
+    profile_query = supabase.table("profiles").select("resume_text").eq("id", user["id"]).single()
+    jobs_query = (
         supabase.table("jobs")
         .select("id, description")
         .eq("user_id", user["id"])
         .is_("match_score", "null")
         .not_.is_("description", "null")
-        .execute()
     )
+    # Both reads are independent round-trips; run them side by side.
+    profile, jobs_resp = await asyncio.gather(
+        asyncio.to_thread(profile_query.execute),
+        asyncio.to_thread(jobs_query.execute),
+    )
+    resume_text = (profile.data or {}).get("resume_text") or ""
+    if not resume_text:
+        return ORJSONResponse({"error": "No resume uploaded"}, status_code=400)
     jobs = jobs_resp.data or []
 
-    scored = 0
-    for job in jobs:
-        try:
-            match = await asyncio.to_thread(score_job_match, job["description"], resume_text)
-            supabase.table("jobs").update({
-                "match_score": match["score"],
-                "match_reasoning": match["reasoning"],
-            }).eq("id", job["id"]).execute()
-            scored += 1
-        except Exception as exc:
-            logger.warning("rescore failed for job %s: %s", job["id"], exc)
-            continue
+    sem = asyncio.Semaphore(RESCORE_CONCURRENCY)
+
+    async def rescore(job: dict) -> bool:
+        async with sem:
+            try:
+                match = await asyncio.to_thread(score_job_match, job["description"], resume_text)
+                await asyncio.to_thread(
+                    supabase.table("jobs").update({
+                        "match_score": match["score"],
+                        "match_reasoning": match["reasoning"],
+                    }).eq("id", job["id"]).execute
+                )
+                return True
+            except Exception as exc:
+                logger.warning("rescore failed for job %s: %s", job["id"], exc)
+                return False
+
+    scored = sum(await asyncio.gather(*(rescore(job) for job in jobs)))
 
     return {"scored": scored, "total": len(jobs)}
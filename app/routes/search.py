@@ -2,30 +2,44 @@
 Search configuration routes
 """
 
+import asyncio
+
 from fastapi import APIRouter, Request, Depends, Form
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 
 from app.auth import get_current_user, supabase
+from app.utils.cache import PAGE_CACHE_CONTROL, etag_matches, invalidate_user_pages, page_etag
 
 router = APIRouter()
 
+# What search_configs.html renders for each config
+_CONFIG_COLUMNS = "id,keywords,location,is_remote,experience_level,pages,boards,is_active"
+
 from app.templating import templates
 
 
 @router.get("/", response_class=HTMLResponse)
 async def list_searches(request: Request, user = Depends(get_current_user)):
     """View and manage search configurations"""
-    
+
+    # Configs only change through the handlers below, which bump the user's
+    # page version — until then the browser's copy is current.
+    etag = await page_etag(user["id"], templates.env.globals["asset_v"], "search")
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": PAGE_CACHE_CONTROL})
+
     try:
-        response = supabase.table("search_configs").select("*").eq("user_id", user["id"]).execute()
-        configs = response.data or []
-        
-        return templates.TemplateResponse(request, "search_configs.html", {
+        query = supabase.table("search_configs").select(_CONFIG_COLUMNS).eq("user_id", user["id"])
+        configs = (await asyncio.to_thread(query.execute)).data or []
+
+        response = templates.TemplateResponse(request, "search_configs.html", {
             "user": user,
             "configs": configs
         })
+        if etag:
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = PAGE_CACHE_CONTROL
+        return response
 
     except Exception as e:
         return templates.TemplateResponse(request, "search_configs.html", {
@@ -62,6 +76,7 @@ async def create_search(
             "boards": selected,
             "is_active": True
         }).execute()
+        await invalidate_user_pages(user["id"])
         
         return RedirectResponse(url="/search", status_code=303)
         
@@ -78,13 +93,9 @@ async def toggle_search(
     """Toggle search config active status"""
     
     try:
-        # Get current status
-        response = supabase.table("search_configs").select("is_active").eq("id", config_id).eq("user_id", user["id"]).execute()
-        
-        if response.data:
-            current_status = response.data[0]["is_active"]
-            # Toggle it
-            supabase.table("search_configs").update({"is_active": not current_status}).eq("id", config_id).execute()
+        # Read-and-flip happens in one Postgres function (migration 003)
+        supabase.rpc("toggle_search_config", {"cid": config_id, "uid": user["id"]}).execute()
+        await invalidate_user_pages(user["id"])
         
         return RedirectResponse(url="/search", status_code=303)
         
@@ -102,6 +113,7 @@ async def delete_search(
     
     try:
         supabase.table("search_configs").delete().eq("id", config_id).eq("user_id", user["id"]).execute()
+        await invalidate_user_pages(user["id"])
         return RedirectResponse(url="/search", status_code=303)
         
     except Exception as e:
@@ -0,0 +1,66 @@
+"""
+Server-side sessions stored in Redis.
+
+Drop-in replacement for Starlette's SessionMiddleware: handlers still read
+and write `request.session`, but the cookie only carries an opaque random
+session id. Loading a session is one Redis GET instead of an HMAC verify +
+base64/JSON decode of the whole payload on every request. Sessions slide:
+each request that carries one pushes its Redis TTL and cookie Max-Age out
+by another max_age.
+"""
+
+import secrets
+
+import orjson
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+
+SESSION_TTL_SEC = 24 * 3600
+
+
+class RedisSessionMiddleware:
+    def __init__(self, app, redis, cookie_name: str = "sid", max_age: int = SESSION_TTL_SEC,
+                 https_only: bool = False):
+        self.app = app
+        self.redis = redis
+        self.cookie_name = cookie_name
+        self.max_age = max_age
+        self.security_flags = "httponly; samesite=lax" + ("; secure" if https_only else "")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        sid = HTTPConnection(scope).cookies.get(self.cookie_name)
+        raw = await self.redis.get(f"sess:{sid}") if sid else None
+        if raw is None:
+            sid = None
+        scope["session"] = orjson.loads(raw) if raw else {}
+        loaded = raw or b"{}"
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                session = scope["session"]
+                headers = MutableHeaders(scope=message)
+                if session:
+                    payload = orjson.dumps(session)
+                    if payload != loaded or sid is None:
+                        sid_out = sid or secrets.token_urlsafe(32)
+                        await self.redis.set(f"sess:{sid_out}", payload, ex=self.max_age)
+                    else:
+                        # Sliding expiry: an active user who only reads
+                        # keeps their session past the first max_age
+                        sid_out = sid
+                        await self.redis.expire(f"sess:{sid}", self.max_age)
+                    headers.append("Set-Cookie", self._cookie(sid_out, self.max_age))
+                elif sid:
+                    # Session cleared (logout): drop it server-side and expire the cookie
+                    await self.redis.delete(f"sess:{sid}")
+                    headers.append("Set-Cookie", self._cookie("null", 0))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _cookie(self, value: str, max_age: int) -> str:
+        return f"{self.cookie_name}={value}; path=/; Max-Age={max_age}; {self.security_flags}"
@@ -0,0 +1,19 @@
+"""
+Static file serving with long-lived caching for versioned assets.
+
+Templates reference CSS as /static/main.css?v=<asset_v>, and asset_v changes
+on every deploy, so a URL carrying `v=` never changes content and browsers
+may keep it for a year without revalidating. Unversioned URLs (favicon)
+keep Starlette's default ETag/Last-Modified revalidation.
+"""
+
+from starlette.staticfiles import StaticFiles
+
+
+class CachedStaticFiles(StaticFiles):
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        query = scope.get("query_string", b"")
+        if query.startswith(b"v=") or b"&v=" in query:
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
@@ -5,13 +5,24 @@ Every route module imports `templates` from here so they all share one
 config — including `asset_v`, a cache-busting version string appended to
 static asset URLs (e.g. /static/main.css?v=<asset_v>). It changes on every
 process start, so a fresh deploy always serves fresh CSS to browsers.
+
+Outside dev (ZEPHYR_ENV=dev, set by `run.py --dev`) templates are not
+re-stat'ed on every render, and compiled template bytecode is cached on
+disk so worker restarts skip re-parsing. The cache uses Jinja's default
+directory: a per-uid _jinja2-cache-<uid> with mode 0700 that Jinja refuses
+to use if its owner or mode is wrong, so other local users can't plant
+bytecode in it.
 """
 
+import os
 import time
 from pathlib import Path
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 _TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
 
 templates = Jinja2Templates(directory=str(_TEMPLATES_DIR))
 templates.env.globals["asset_v"] = str(int(time.time()))
+templates.env.auto_reload = os.getenv("ZEPHYR_ENV") == "dev"
+templates.env.bytecode_cache = FileSystemBytecodeCache()
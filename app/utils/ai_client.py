@@ -8,11 +8,18 @@ Selected via the LLM_PROVIDER env var:
 Both providers run the same prompts and return the same shape, so callers
 (`analyze_job`, `score_job_match`, plus the upcoming tailoring functions)
 do not care which is active. Flip LLM_PROVIDER to swap.
+
+`analyze_job_async` / `score_job_match_async` are the same calls on the
+providers' async clients, for callers already running an event loop (the
+scraper). Those clients are bound to the loop that first used them, so call
+`aclose_async_clients()` before that loop ends.
 """
 
-import json
 import os
 import re
+import threading
+
+import orjson
 from dotenv import load_dotenv
 
 # .env wins over the shell (some envs export ANTHROPIC_API_KEY="" or
@@ -27,105 +34,227 @@ _SYSTEM = (
     "You are an expert technical recruiter. Analyze job postings and extract "
     "structured information. Return only valid JSON."
 )
+# Gemini takes no system prompt here, so it goes in front of the user prompt.
+_GEMINI_PREFIX = f"{_SYSTEM}\n\n"
 _SYSTEM_BLOCK = [{"type": "text", "text": _SYSTEM, "cache_control": {"type": "ephemeral"}}]
 
 
 # ─────────────────────── provider clients (lazy) ───────────────────────
+# One client per process, so every call reuses its keep-alive connection
+# pool. Callers run us from several worker threads at once (the scraper's
+# analysis pool), so creation is locked — otherwise the first concurrent
+# calls would each build, and then drop, a client of their own.
 
 _anthropic_client = None
 _gemini_client = None
+_client_lock = threading.Lock()
 
 
 def _get_anthropic():
     global _anthropic_client
     if _anthropic_client is None:
-        import anthropic
-        key = os.environ.get("ANTHROPIC_API_KEY")
-        if not key:
-            raise RuntimeError("ANTHROPIC_API_KEY is missing or empty.")
-        _anthropic_client = anthropic.Anthropic(api_key=key)
+        with _client_lock:
+            if _anthropic_client is None:
+                import anthropic
+                key = os.environ.get("ANTHROPIC_API_KEY")
+                if not key:
+                    raise RuntimeError("ANTHROPIC_API_KEY is missing or empty.")
+                _anthropic_client = anthropic.Anthropic(api_key=key)
     return _anthropic_client
 
 
 def _get_gemini():
     global _gemini_client
     if _gemini_client is None:
-        from google import genai
-        key = os.environ.get("GEMINI_API_KEY")
-        if not key:
-            raise RuntimeError("GEMINI_API_KEY is missing or empty.")
-        _gemini_client = genai.Client(api_key=key)
+        with _client_lock:
+            if _gemini_client is None:
+                from google import genai
+                key = os.environ.get("GEMINI_API_KEY")
+                if not key:
+                    raise RuntimeError("GEMINI_API_KEY is missing or empty.")
+                _gemini_client = genai.Client(api_key=key)
     return _gemini_client
 
 
+# Async clients are only touched from one event loop, so no lock is needed.
+_async_anthropic_client = None
+
+
+def _get_async_anthropic():
+    global _async_anthropic_client
+    if _async_anthropic_client is None:
+        import anthropic
+        key = os.environ.get("ANTHROPIC_API_KEY")
+        if not key:
+            raise RuntimeError("ANTHROPIC_API_KEY is missing or empty.")
+        _async_anthropic_client = anthropic.AsyncAnthropic(api_key=key)
+    return _async_anthropic_client
+
+
+async def aclose_async_clients() -> None:
+    """Close the async provider clients so the next event loop gets fresh ones."""
+    global _async_anthropic_client, _gemini_client
+    if _async_anthropic_client is not None:
+        await _async_anthropic_client.close()
+        _async_anthropic_client = None
+    with _client_lock:
+        gemini, _gemini_client = _gemini_client, None
+    if gemini is not None:
+        # Gemini's sync and async halves share one Client; drop it whole so
+        # the next caller doesn't get a closed .aio. Older google-genai
+        # releases have no AsyncClient.aclose — nothing to release there.
+        aclose = getattr(gemini.aio, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
 # ─────────────────────── unified call ───────────────────────
 
+def _unknown_provider() -> RuntimeError:
+    return RuntimeError(
+        f"Unknown LLM_PROVIDER: {LLM_PROVIDER!r}. Use 'gemini' or 'anthropic'."
+    )
+
+
+def _gemini_kwargs(prompt: str, max_tokens: int) -> dict:
+    return {
+        "model": GEMINI_MODEL,
+        "contents": _GEMINI_PREFIX + prompt,
+        "config": {
+            "max_output_tokens": max_tokens,
+            "temperature": 0.3,
+            # Constrained decoding: the reply is the JSON object and nothing
+            # else, so generation ends at its closing brace (no fences or
+            # trailing commentary to pay for).
+            "response_mime_type": "application/json",
+        },
+    }
+
+
+def _anthropic_kwargs(prompt: str, max_tokens: int) -> dict:
+    return {
+        "model": ANTHROPIC_MODEL,
+        "max_tokens": max_tokens,
+        "system": _SYSTEM_BLOCK,
+        "messages": [{"role": "user", "content": prompt}],
+    }
+
+
 def _llm_call(prompt: str, max_tokens: int) -> str:
     """Send one prompt to whichever provider is configured. Returns raw text."""
     if LLM_PROVIDER == "gemini":
-        client = _get_gemini()
-        resp = client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=f"{_SYSTEM}\n\n{prompt}",
-            config={
-                "max_output_tokens": max_tokens,
-                "temperature": 0.3,
-            },
+        resp = _get_gemini().models.generate_content(**_gemini_kwargs(prompt, max_tokens))
+        return (resp.text or "").strip()
+
+    if LLM_PROVIDER == "anthropic":
+        resp = _get_anthropic().messages.create(**_anthropic_kwargs(prompt, max_tokens))
+        return resp.content[0].text
+
+    raise _unknown_provider()
+
+
+async def _allm_call(prompt: str, max_tokens: int) -> str:
+    """Async twin of `_llm_call` — awaits the provider instead of blocking."""
+    if LLM_PROVIDER == "gemini":
+        resp = await _get_gemini().aio.models.generate_content(
+            **_gemini_kwargs(prompt, max_tokens)
         )
         return (resp.text or "").strip()
 
     if LLM_PROVIDER == "anthropic":
-        client = _get_anthropic()
-        resp = client.messages.create(
-            model=ANTHROPIC_MODEL,
-            max_tokens=max_tokens,
-            system=_SYSTEM_BLOCK,
-            messages=[{"role": "user", "content": prompt}],
+        resp = await _get_async_anthropic().messages.create(
+            **_anthropic_kwargs(prompt, max_tokens)
         )
         return resp.content[0].text
 
-    raise RuntimeError(
-        f"Unknown LLM_PROVIDER: {LLM_PROVIDER!r}. Use 'gemini' or 'anthropic'."
-    )
+    raise _unknown_provider()
+
+
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\n?")
+_FENCE_CLOSE_RE = re.compile(r"\n?```$")
 
 
 def _parse_json(raw: str) -> dict:
     raw = raw.strip()
     if raw.startswith("```"):
-        raw = re.sub(r"^```(?:json)?\n?", "", raw)
-        raw = re.sub(r"\n?```$", "", raw)
+        raw = _FENCE_OPEN_RE.sub("", raw)
+        raw = _FENCE_CLOSE_RE.sub("", raw)
     try:
-        return json.loads(raw.strip())
-    except json.JSONDecodeError as e:
+        return orjson.loads(raw.strip())
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON from model: {e}") from e
 
 
 # ─────────────────────── public API ───────────────────────
 
+_NO_ANALYSIS = {"summary": "—", "requirements": ""}
+
+
+_ANALYZE_PROMPT = (
+    "Analyze this job posting and return ONLY valid JSON:\n"
+    '{"summary": "2-3 sentences: what the company does, the role, YOE if stated",'
+    ' "requirements": ["tool1", "skill2"]}\n\n'
+    "Rules:\n"
+    "- requirements: hard skills and tools only, no soft skills\n"
+    "- requirements: [] if none found\n\n"
+    "Job posting:\n"
+)
+
+
+def _analyze_prompt(description: str) -> str:
+    return _ANALYZE_PROMPT + description[:3000]
+
+
+def _analysis_result(parsed: dict) -> dict:
+    reqs = [r for r in parsed.get("requirements", []) if r]
+    return {
+        "summary": parsed.get("summary", "—"),
+        "requirements": ", ".join(reqs),
+    }
+
+
 def analyze_job(description: str) -> dict:
     """Return {'summary': str, 'requirements': comma-separated str}."""
     if not description:
-        return {"summary": "—", "requirements": ""}
-
-    prompt = (
-        "Analyze this job posting and return ONLY valid JSON:\n"
-        '{"summary": "2-3 sentences: what the company does, the role, YOE if stated",'
-        ' "requirements": ["tool1", "skill2"]}\n\n'
-        "Rules:\n"
-        "- requirements: hard skills and tools only, no soft skills\n"
-        "- requirements: [] if none found\n\n"
-        f"Job posting:\n{description[:3000]}"
-    )
+        return dict(_NO_ANALYSIS)
     try:
-        parsed = _parse_json(_llm_call(prompt, max_tokens=512))
+        parsed = _parse_json(_llm_call(_analyze_prompt(description), max_tokens=512))
     except Exception as exc:
         print(f"[ai_client.analyze_job] {type(exc).__name__}: {exc}")
-        return {"summary": "—", "requirements": ""}
+        return dict(_NO_ANALYSIS)
+    return _analysis_result(parsed)
 
-    reqs = [r for r in parsed.get("requirements", []) if r]
+
+async def analyze_job_async(description: str) -> dict:
+    """`analyze_job` on the async client."""
+    if not description:
+        return dict(_NO_ANALYSIS)
+    try:
+        parsed = _parse_json(await _allm_call(_analyze_prompt(description), max_tokens=512))
+    except Exception as exc:
+        print(f"[ai_client.analyze_job_async] {type(exc).__name__}: {exc}")
+        return dict(_NO_ANALYSIS)
+    return _analysis_result(parsed)
+
+
+_MATCH_PROMPT = (
+    "Score how well this candidate matches this job. Return ONLY valid JSON:\n"
+    '{"score": <0-100>, "reasoning": "<one sentence>"}\n\n'
+    "Resume:\n"
+)
+
+
+def _match_prompt(job_description: str, resume_text: str) -> str:
+    return (
+        f"{_MATCH_PROMPT}{resume_text[:2000]}\n\n"
+        f"Job posting:\n{job_description[:2000]}"
+    )
+
+
+def _match_result(parsed: dict) -> dict:
     return {
-        "summary": parsed.get("summary", "—"),
-        "requirements": ", ".join(reqs),
+        "score": int(parsed.get("score", 0)),
+        "reasoning": parsed.get("reasoning", ""),
     }
 
 
@@ -133,20 +262,23 @@ def score_job_match(job_description: str, resume_text: str) -> dict:
     """Return {'score': 0..100, 'reasoning': str}."""
     if not job_description or not resume_text:
         return {"score": 0, "reasoning": "Insufficient data"}
-
-    prompt = (
-        "Score how well this candidate matches this job. Return ONLY valid JSON:\n"
-        '{"score": <0-100>, "reasoning": "<one sentence>"}\n\n'
-        f"Resume:\n{resume_text[:2000]}\n\n"
-        f"Job posting:\n{job_description[:2000]}"
-    )
+    prompt = _match_prompt(job_description, resume_text)
     try:
         parsed = _parse_json(_llm_call(prompt, max_tokens=256))
     except Exception as exc:
         print(f"[ai_client.score_job_match] {type(exc).__name__}: {exc}")
         return {"score": 0, "reasoning": "Analysis unavailable"}
+    return _match_result(parsed)
 
-    return {
-        "score": int(parsed.get("score", 0)),
-        "reasoning": parsed.get("reasoning", ""),
-    }
+
+async def score_job_match_async(job_description: str, resume_text: str) -> dict:
+    """`score_job_match` on the async client."""
+    if not job_description or not resume_text:
+        return {"score": 0, "reasoning": "Insufficient data"}
+    prompt = _match_prompt(job_description, resume_text)
+    try:
+        parsed = _parse_json(await _allm_call(prompt, max_tokens=256))
+    except Exception as exc:
+        print(f"[ai_client.score_job_match_async] {type(exc).__name__}: {exc}")
+        return {"score": 0, "reasoning": "Analysis unavailable"}
+    return _match_result(parsed)
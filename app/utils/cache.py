@@ -0,0 +1,140 @@
+"""
+Optional Redis connection shared by the web app.
+
+Enabled by setting REDIS_URL. Callers must handle `get_redis()` returning
+None and fall back to their non-Redis behaviour, so local dev and the
+free-tier deploy keep working without a Redis instance.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from typing import Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.environ.get("REDIS_URL")
+
+_redis = None
+
+
+def get_redis():
+    """Lazily-created redis.asyncio client, or None when REDIS_URL is unset."""
+    global _redis
+    if _redis is None and REDIS_URL:
+        import redis.asyncio as aioredis
+        _redis = aioredis.Redis.from_url(REDIS_URL, decode_responses=False)
+    return _redis
+
+
+# ─────────────────────── JSON cache helpers ───────────────────────
+# All no-ops without Redis. Redis errors are logged and treated as a cache
+# miss — a cache outage must never take a page down with it.
+
+async def cache_get_json(key: str):
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        raw = await redis.get(key)
+    except Exception as exc:
+        logger.warning("cache get %s failed: %s", key, exc)
+        return None
+    return orjson.loads(raw) if raw else None
+
+
+async def cache_set_json(key: str, value, ttl: int) -> None:
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(key, orjson.dumps(value), ex=ttl)
+    except Exception as exc:
+        logger.warning("cache set %s failed: %s", key, exc)
+
+
+async def cache_delete(*keys: str) -> None:
+    redis = get_redis()
+    if redis is None or not keys:
+        return
+    try:
+        await redis.delete(*keys)
+    except Exception as exc:
+        logger.warning("cache delete %s failed: %s", keys, exc)
+
+
+def dashboard_cache_key(user_id: str) -> str:
+    return f"dash:{user_id}"
+
+
+def board_cache_key(user_id: str, etag: str) -> str:
+    """The board page's ETag already folds in the user's page version and
+    the filter/sort/page query, so a write moves readers onto a fresh key
+    and the old entries simply expire."""
+    return f"board:{user_id}:{etag}"
+
+
+# ─────────────────────── Per-user page versions ───────────────────────
+# A token that changes whenever the user's jobs/configs/resume do. Pages
+# derive their ETag from it so a revalidating browser gets a 304 without a
+# Supabase round trip or a template render. The key expires so writes made
+# outside the web app (the scheduled scraper, the cleanup runner) and
+# day-boundary stats still show up within USER_VERSION_TTL_SEC.
+
+USER_VERSION_TTL_SEC = 300
+
+PAGE_CACHE_CONTROL = "private, no-cache"
+
+
+def _user_version_key(user_id: str) -> str:
+    return f"uver:{user_id}"
+
+
+async def user_version(user_id: str) -> Optional[str]:
+    """Current version token for the user's pages, or None without Redis."""
+    redis = get_redis()
+    if redis is None:
+        return None
+    key = _user_version_key(user_id)
+    try:
+        raw = await redis.get(key)
+        if raw is None:
+            raw = str(time.time_ns()).encode()
+            await redis.set(key, raw, ex=USER_VERSION_TTL_SEC)
+    except Exception as exc:
+        logger.warning("user version %s failed: %s", key, exc)
+        return None
+    return raw.decode()
+
+
+async def page_etag(user_id: str, *parts: str) -> Optional[str]:
+    """Weak ETag for a user's page; `parts` are whatever else the HTML
+    depends on (query string, asset version). None disables revalidation."""
+    version = await user_version(user_id)
+    if version is None:
+        return None
+    digest = hashlib.blake2s("|".join((user_id, version, *parts)).encode(), digest_size=8)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    if not etag or not if_none_match:
+        return False
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+async def invalidate_user_pages(user_id: str) -> None:
+    """Call after any write that changes what the user's pages show: drops
+    the cached dashboard stats and moves the user onto a new ETag."""
+    await cache_delete(dashboard_cache_key(user_id))
+    redis = get_redis()
+    if redis is None:
+        return
+    key = _user_version_key(user_id)
+    try:
+        await redis.set(key, str(time.time_ns()), ex=USER_VERSION_TTL_SEC)
+    except Exception as exc:
+        logger.warning("user version bump %s failed: %s", key, exc)
@@ -29,11 +29,13 @@ def cleanup_stale_jobs(supabase_client, user_id: Optional[str] = None) -> dict:
     ignored_cutoff = (now - timedelta(days=IGNORED_SWEEP_DAYS)).isoformat()
 
     breakdown = {"new_unviewed": 0, "new_viewed": 0, "ignored": 0}
+    # Deletes ask PostgREST for an exact count and no row bodies, so the
+    # breakdown never depends on shipping the deleted rows back.
 
     # 1) New + never viewed + older than 14d
     q = (
         supabase_client.table("jobs")
-        .delete()
+        .delete(count="exact", returning="minimal")
         .eq("status", "New")
         .is_("last_viewed_at", "null")
         .lt("created_at", new_cutoff)
@@ -41,31 +43,31 @@ def cleanup_stale_jobs(supabase_client, user_id: Optional[str] = None) -> dict:
     if user_id:
         q = q.eq("user_id", user_id)
     resp = q.execute()
-    breakdown["new_unviewed"] = len(resp.data or [])
+    breakdown["new_unviewed"] = resp.count or 0
 
     # 2) New + viewed but no engagement for 14d
     q = (
         supabase_client.table("jobs")
-        .delete()
+        .delete(count="exact", returning="minimal")
         .eq("status", "New")
         .lt("last_viewed_at", new_cutoff)
     )
     if user_id:
         q = q.eq("user_id", user_id)
     resp = q.execute()
-    breakdown["new_viewed"] = len(resp.data or [])
+    breakdown["new_viewed"] = resp.count or 0
 
     # 3) Ignored older than 1d (safety sweep — immediate deletion lives in routes)
     q = (
         supabase_client.table("jobs")
-        .delete()
+        .delete(count="exact", returning="minimal")
         .eq("status", "Ignored")
         .lt("updated_at", ignored_cutoff)
     )
     if user_id:
         q = q.eq("user_id", user_id)
     resp = q.execute()
-    breakdown["ignored"] = len(resp.data or [])
+    breakdown["ignored"] = resp.count or 0
 
     total = sum(breakdown.values())
 
@@ -0,0 +1,14 @@
+-- Manual migration: run in the Supabase SQL Editor (https://app.supabase.com → SQL Editor).
+-- This file is documentation only — it is NOT run by any automated migration tool.
+
+-- Per-status job counts for one user, so the job board can show its stat
+-- cards without downloading every row. NULL status counts as 'New'.
+CREATE OR REPLACE FUNCTION jobs_status_counts(uid uuid)
+RETURNS TABLE(status text, n bigint)
+LANGUAGE sql STABLE
+AS $$
+  SELECT COALESCE(j.status, 'New') AS status, COUNT(*) AS n
+  FROM jobs j
+  WHERE j.user_id = uid
+  GROUP BY 1
+$$;
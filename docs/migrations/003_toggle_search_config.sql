@@ -0,0 +1,15 @@
+-- Manual migration: run in the Supabase SQL Editor (https://app.supabase.com → SQL Editor).
+-- This file is documentation only — it is NOT run by any automated migration tool.
+
+-- Flip a search config's is_active in one statement (one round trip instead
+-- of SELECT + UPDATE). Returns the new value, or NULL if the config does not
+-- belong to the user.
+CREATE OR REPLACE FUNCTION toggle_search_config(cid bigint, uid uuid)
+RETURNS boolean
+LANGUAGE sql
+AS $$
+  UPDATE search_configs
+  SET is_active = NOT is_active
+  WHERE id = cid AND user_id = uid
+  RETURNING is_active
+$$;
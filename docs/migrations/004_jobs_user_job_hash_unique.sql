@@ -0,0 +1,17 @@
+-- Manual migration: run in the Supabase SQL Editor (https://app.supabase.com → SQL Editor).
+-- This file is documentation only — it is NOT run by any automated migration tool.
+
+-- One row per (user, job). The scraper saves a whole search's results with a
+-- single upsert(on_conflict="user_id,job_hash", ignore_duplicates=True), which
+-- needs this unique index to recognise jobs the user already has.
+
+-- The scraper checked for duplicates before inserting, so there should be
+-- none; this lists any that slipped through. Delete them before creating
+-- the index, keeping the oldest row of each pair.
+SELECT user_id, job_hash, COUNT(*)
+FROM jobs
+GROUP BY user_id, job_hash
+HAVING COUNT(*) > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_user_id_job_hash_key
+  ON jobs (user_id, job_hash);
@@ -0,0 +1,11 @@
+-- Manual migration: run in the Supabase SQL Editor (https://app.supabase.com → SQL Editor).
+-- This file is documentation only — it is NOT run by any automated migration tool.
+
+-- job_hash switches from SHA-256 to MD5 (scrapers.job_hash). Recompute the
+-- stored hashes the same way so the scraper still recognises existing jobs:
+-- md5(lower("<title>_<company>_<location>")), where Python renders a missing
+-- value as 'None'. Run this right before deploying the new scraper.
+UPDATE jobs
+SET job_hash = md5(lower(
+  COALESCE(title, 'None') || '_' || COALESCE(company, 'None') || '_' || COALESCE(location, 'None')
+));
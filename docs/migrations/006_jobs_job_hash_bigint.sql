@@ -0,0 +1,11 @@
+-- Manual migration: run in the Supabase SQL Editor (https://app.supabase.com → SQL Editor).
+-- This file is documentation only — it is NOT run by any automated migration tool.
+
+-- job_hash becomes a bigint: the first 8 bytes of the MD5 key from migration
+-- 005, read as a signed 64-bit integer (scrapers.job_hash). 8 bytes per row
+-- instead of a 32-char string keeps the (user_id, job_hash) unique index
+-- small; Postgres rebuilds it as part of the type change. Requires 005 to
+-- have run (job_hash holds md5 hex). Run right before deploying the new scraper.
+ALTER TABLE jobs
+  ALTER COLUMN job_hash TYPE bigint
+  USING ('x' || left(job_hash, 16))::bit(64)::bigint;
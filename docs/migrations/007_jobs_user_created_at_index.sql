@@ -0,0 +1,16 @@
+-- Manual migration: run in the Supabase SQL Editor (https://app.supabase.com → SQL Editor).
+-- This file is documentation only — it is NOT run by any automated migration tool.
+
+-- Every per-user jobs listing is ordered by creation time: the job board
+-- (newest first) and the dashboard's stat rows (oldest first, for the week
+-- bisection). With this index both are an index range scan on the user's
+-- rows instead of a filter plus sort. (user_id, job_hash) is already covered
+-- by the unique index from migration 004.
+CREATE INDEX IF NOT EXISTS jobs_user_id_created_at_idx
+  ON jobs (user_id, created_at DESC);
+
+-- Dashboard "Recent applications": the user's last 10 Applied jobs by
+-- applied_at. A partial index keeps it to the Applied rows only.
+CREATE INDEX IF NOT EXISTS jobs_user_id_applied_at_idx
+  ON jobs (user_id, applied_at DESC NULLS LAST)
+  WHERE status = 'Applied';
@@ -0,0 +1,11 @@
+-- Manual migration: run in the Supabase SQL Editor (https://app.supabase.com → SQL Editor).
+-- This file is documentation only — it is NOT run by any automated migration tool.
+
+-- The job board shows a one-line description snippet per row; the full text
+-- is only fetched when a row is expanded (GET /job-board/{id}/detail). A
+-- stored generated column lets the board query select the snippet without
+-- shipping whole descriptions. 161 characters so the template can tell
+-- whether to add an ellipsis after the first 160.
+ALTER TABLE jobs
+  ADD COLUMN IF NOT EXISTS description_snippet text
+  GENERATED ALWAYS AS (left(description, 161)) STORED;
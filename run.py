@@ -3,33 +3,51 @@
 Start the Zephyr application
 """
 
-import uvicorn
+import logging
 import os
+import sys
+
+import uvicorn
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger("zephyr")
+
 if __name__ == "__main__":
     # Check for required environment variables
     required_vars = ["SUPABASE_URL", "SUPABASE_ANON_KEY"]
     missing = [var for var in required_vars if not os.getenv(var)]
-    
+
     if missing:
-        print(f"❌ Error: Missing required environment variables: {', '.join(missing)}")
-        print("   Please set them in your .env file")
-        exit(1)
-    
-    print("🌪️  Starting Zephyr Server")
-    print("=" * 60)
-    print(f"📍 Local:   http://localhost:8000")
-    print(f"📍 Network: http://0.0.0.0:8000")
-    print("=" * 60)
-    
+        logger.error("Missing required environment variables: %s (set them in your .env file)", ", ".join(missing))
+        sys.exit(1)
+
+    # Dev (--dev or ZEPHYR_ENV=dev): single worker with auto-reload on code changes.
+    # Otherwise no file watcher. One worker unless WEB_CONCURRENCY says so: the
+    # scrape-now lock and cooldown (_SCRAPE_STATE in app/routes/jobs.py) are
+    # per process, and cpu_count() reports the host's cores inside containers.
+    dev = "--dev" in sys.argv[1:] or os.getenv("ZEPHYR_ENV") == "dev"
+    if dev:
+        os.environ["ZEPHYR_ENV"] = "dev"  # inherited by the reloader's worker
+
+    port = int(os.getenv("PORT", "8000"))
+    workers = 1 if dev else int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    logger.info(
+        "Starting Zephyr on http://0.0.0.0:%d (%s, %d worker%s)",
+        port, "dev" if dev else "prod", workers, "" if workers == 1 else "s",
+    )
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
-        port=8000,
-        reload=True,  # Auto-reload on code changes
+        port=port,
+        loop="auto",  # uvloop when installed (not on Windows), else asyncio
+        http="httptools",
+        workers=workers,
+        reload=dev,
         log_level="info"
     )
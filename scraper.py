@@ -5,21 +5,36 @@ Scrapes LinkedIn with anti-detection features
 
 import os
 import asyncio
+import functools
 import hashlib
 import re
 import random
+import threading
 from datetime import datetime, timedelta
+from typing import Optional
 from urllib.parse import quote_plus
+import orjson
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from playwright.async_api import async_playwright
-from app.utils.ai_client import analyze_job, score_job_match
+from selectolax.lexbor import LexborHTMLParser
+from app.utils.ai_client import aclose_async_clients, analyze_job_async, score_job_match_async
+from scrapers import RateLimiter, get_with_backoff, http_client, job_hash
 
 # Load environment variables
 load_dotenv()
 
 # Configuration
-SCRAPE_DELAY = 3  # seconds between users
+SCRAPE_CONCURRENCY = 4  # search configs scraped at once (sharing one browser)
+FETCH_BATCH = 4   # job descriptions fetched concurrently (one browser tab each)
+AI_CONCURRENCY = 4  # jobs analyzed by the LLM at once
+LINKEDIN_PAGE_CONCURRENCY = 3  # search-result pages open at once per search
+LINKEDIN_MIN_INTERVAL = 1.0    # seconds between guest-API requests, across all searches
+# Optional Playwright storage_state file (cookies + localStorage). Browser
+# searches start from it and write it back, so LinkedIn sees a returning
+# session instead of a fresh anonymous one on every run.
+LINKEDIN_STORAGE_STATE = os.environ.get("LINKEDIN_STORAGE_STATE")
+LLM_MEMO_MAX = 4096  # distinct (prompt, inputs) results kept per run; cleared wholesale when full
 
 # Human-like behavior settings
 MIN_DELAY = 1.0   # minimum delay between actions (seconds)
@@ -27,6 +42,16 @@ MAX_DELAY = 4.0   # maximum delay between actions (seconds)
 MIN_SCROLL = 100   # minimum scroll distance
 MAX_SCROLL = 400   # maximum scroll distance
 
+# Extractor patterns, compiled once
+# "2 days ago", "1 week ago", ... inside a card's metadata text
+_POSTED_AGO_RE = re.compile(r'(\d+\s*(?:day|week|hour|minute|month)s?\s*ago)', re.IGNORECASE)
+# $80K - $120K per year / $80,000 - $120,000 per year
+_SALARY_RE = re.compile(r'\$?([\d,]+(?:\.\d+)?)\s*(K|k)?')
+# "3 days ago", "30+ days ago", "1 hour ago": the count and its unit in one match
+_POSTED_UNIT_RE = re.compile(r'(\d+)\+?\s*(minute|hour|day|week|month)', re.IGNORECASE)
+_UNIT_DAYS = {"minute": 0, "hour": 0, "day": 1, "week": 7, "month": 30}
+_LINKEDIN_JOB_ID_RE = re.compile(r"(\d{8,})")
+
 # Initialize Supabase client
 supabase: Client = create_client(
     os.environ.get("SUPABASE_URL"),
@@ -117,10 +142,10 @@ def random_viewport():
     return random.choice(viewports)
 
 
-def generate_job_hash(title, company, location):
-    """Generate unique hash for job deduplication"""
-    unique_string = f"{title}_{company}_{location}".lower()
-    return hashlib.sha256(unique_string.encode()).hexdigest()
+def _salary_amount(match):
+    """Whole-unit amount from a _SALARY_RE match ("80K" → 80000)."""
+    amount = int(match.group(1).replace(",", ""))
+    return amount * 1000 if match.group(2) else amount
 
 
 def extract_salary(salary_text):
@@ -128,132 +153,221 @@ def extract_salary(salary_text):
     if not salary_text:
         return None, None, None
 
-    # Pattern: $80K - $120K per year (or similar)
-    # Pattern: $80,000 - $120,000 per year
-    salary_pattern = r'\$?([\d,]+(?:\.\d+)?)\s*(K|k)?'
-    matches = re.findall(salary_pattern, salary_text)
-
     currency = "USD" if "$" in salary_text else None
 
-    if len(matches) >= 2:
-        min_sal = int(matches[0][0].replace(",", ""))
-        max_sal = int(matches[1][0].replace(",", ""))
-        # Handle K suffix
-        if matches[0][1].lower() == 'k':
-            min_sal *= 1000
-        if matches[1][1].lower() == 'k':
-            max_sal *= 1000
-        return min_sal, max_sal, currency
-    elif len(matches) == 1:
-        sal = int(matches[0][0].replace(",", ""))
-        if matches[0][1].lower() == 'k':
-            sal *= 1000
-        return sal, sal, currency
-
-    return None, None, currency
-
-
-def extract_posted_date(posted_text):
-    """Convert posted text to ISO date"""
-    if not posted_text:
+    # Only the first two amounts matter; stop scanning after them.
+    matches = _SALARY_RE.finditer(salary_text)
+    first = next(matches, None)
+    if first is None:
+        return None, None, currency
+    second = next(matches, None)
+
+    min_sal = _salary_amount(first)
+    max_sal = _salary_amount(second) if second else min_sal
+    return min_sal, max_sal, currency
+
+
+@functools.lru_cache(maxsize=512)
+def _posted_days_ago(posted_text):
+    """Days ago for "3 days ago" / "2 weeks ago" style text (0 for minutes or
+    hours), or None if unrecognised. Pure, so cached: a results page repeats
+    the same handful of strings."""
+    m = _POSTED_UNIT_RE.search(posted_text)
+    if not m:
         return None
+    return int(m.group(1)) * _UNIT_DAYS[m.group(2).lower()]
 
-    posted_text = posted_text.lower().strip()
 
-    # Extract number
-    num_match = re.search(r'(\d+)', posted_text)
-    if not num_match:
+def extract_posted_date(posted_text, now=None):
+    """Convert posted text to ISO date, relative to `now` (default: current time)"""
+    if not posted_text:
         return None
 
-    num = int(num_match.group(1))
-
-    # Calculate date
-    if "minute" in posted_text or "hour" in posted_text:
-        return datetime.now().isoformat()
-    elif "day" in posted_text:
-        days_ago = num
-    elif "week" in posted_text:
-        days_ago = num * 7
-    elif "month" in posted_text:
-        days_ago = num * 30
-    else:
+    days_ago = _posted_days_ago(posted_text)
+    if days_ago is None:
         return None
 
-    from datetime import timedelta
-    posted_date = datetime.now() - timedelta(days=days_ago)
+    posted_date = (now or datetime.now()) - timedelta(days=days_ago)
     return posted_date.isoformat()
 
 
-def extract_job_type(metadata_text):
-    """Extract job type from metadata"""
-    if not metadata_text:
-        return None
+# Metadata token → label tables, checked in priority order (first hit wins:
+# "mid-senior" must come before "senior").
+_JOB_TYPES = (
+    ("full-time", "Full-time"),
+    ("part-time", "Part-time"),
+    ("contract", "Contract"),
+    ("internship", "Internship"),
+    ("temporary", "Temporary"),
+)
+_EXPERIENCE_LEVELS = (
+    ("entry", "Entry"),
+    ("associate", "Associate"),
+    ("mid-senior", "Mid-Senior"),
+    ("senior", "Senior"),
+    ("director", "Director"),
+    ("executive", "Executive"),
+)
+_WORK_TYPES = (
+    ("remote", "Remote"),
+    ("hybrid", "Hybrid"),
+    ("onsite", "On-site"),
+    ("on-site", "On-site"),
+)
+
+
+def _first_label(text, table):
+    return next((label for token, label in table if token in text), None)
 
+
+@functools.lru_cache(maxsize=512)
+def classify_metadata(metadata_text):
+    """(job_type, experience_level) from a card's metadata text, lowercasing
+    it once for both lookups."""
+    if not metadata_text:
+        return None, None
     text = metadata_text.lower()
-    if "full-time" in text:
-        return "Full-time"
-    elif "part-time" in text:
-        return "Part-time"
-    elif "contract" in text:
-        return "Contract"
-    elif "internship" in text:
-        return "Internship"
-    elif "temporary" in text:
-        return "Temporary"
+    return _first_label(text, _JOB_TYPES), _first_label(text, _EXPERIENCE_LEVELS)
 
-    return None
+
+def extract_job_type(metadata_text):
+    """Extract job type from metadata"""
+    return classify_metadata(metadata_text)[0]
 
 
 def extract_experience_level(metadata_text):
     """Extract experience level from metadata"""
-    if not metadata_text:
-        return None
-
-    text = metadata_text.lower()
-    if "entry" in text:
-        return "Entry"
-    elif "associate" in text:
-        return "Associate"
-    elif "mid-senior" in text:
-        return "Mid-Senior"
-    elif "senior" in text:
-        return "Senior"
-    elif "director" in text:
-        return "Director"
-    elif "executive" in text:
-        return "Executive"
-
-    return None
+    return classify_metadata(metadata_text)[1]
 
 
+@functools.lru_cache(maxsize=512)
 def extract_work_type(metadata_text):
     """Extract work type (remote, hybrid, onsite)"""
     if not metadata_text:
         return None
+    return _first_label(metadata_text.lower(), _WORK_TYPES)
 
-    text = metadata_text.lower()
-    if "remote" in text:
-        return "Remote"
-    elif "hybrid" in text:
-        return "Hybrid"
-    elif "onsite" in text or "on-site" in text:
-        return "On-site"
 
-    return None
+# Chromium flags that hide the most obvious automation tells.
+_LAUNCH_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+)
+
+# Injected into every search context before any page script runs.
+_STEALTH_JS = """
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+});
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [1, 2, 3, 4, 5]
+});
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en']
+});
+window.chrome = { runtime: {} };
+"""
 
 
+class SharedBrowser:
+    """One Chromium for the whole run, launched on first use.
 
+    Every config and the description fetches open their own (cheap) context
+    on it instead of each cold-starting a browser. Runs where the LinkedIn
+    guest endpoint covers everything never launch Chromium at all.
+    """
 
-import re as _re
-from typing import Optional as _Optional
+    def __init__(self):
+        self._playwright = None
+        self._browser = None
+        self._lock = asyncio.Lock()
+
+    async def get(self):
+        async with self._lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                # Launch browser with stealth settings
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True, args=list(_LAUNCH_ARGS),
+                )
+        return self._browser
+
+    async def close(self):
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._browser = self._playwright = None
+
+
+# We only read text off LinkedIn pages; skipping these cuts most of the bytes.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+# Tracking/telemetry endpoints: scripts and beacons that keep the page busy
+# without affecting the job markup.
+_BLOCKED_URL_PARTS = ("/li/track", "licdn.com/sensor", "px.ads.linkedin.com", "google-analytics.com")
+
+
+async def _block_heavy_resources(route):
+    """context.route handler: abort images/CSS/fonts/media and trackers,
+    pass the rest."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in _BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
 
 
-def _extract_linkedin_job_id(url: str) -> _Optional[str]:
+def _extract_linkedin_job_id(url: str) -> Optional[str]:
     """Pull the trailing numeric job ID out of a LinkedIn job URL."""
-    m = _re.search(r"(\d{8,})", url or "")
+    m = _LINKEDIN_JOB_ID_RE.search(url or "")
     return m.group(1) if m else None
 
 
+_GUEST_POSTING_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{}"
+_DESCRIPTION_SELECTOR = ".show-more-less-html__markup, .description__text, section.description"
+# Anything shorter is a stub or an error page, not a job description.
+MIN_DESCRIPTION_LEN = 80
+
+# Description text in one CDP round trip: the known description containers,
+# falling back to the page's main/article for unexpected layouts.
+_READ_DESCRIPTION_JS = """
+([selector, minLen]) => {
+    const text = sel => { const el = document.querySelector(sel); return el ? el.innerText : null; };
+    const description = text(selector);
+    return description && description.length >= minLen ? description : text('main, article');
+}
+"""
+
+
+def _description_from_guest_html(html):
+    """Description text from a guest job-posting page, or None if it has none."""
+    elem = LexborHTMLParser(html).css_first(_DESCRIPTION_SELECTOR)
+    description = elem.text(separator="\n", strip=True) if elem else None
+    if not description or len(description) < MIN_DESCRIPTION_LEN:
+        return None
+    return description[:10000]
+
+
+async def fetch_job_description(client, job_url):
+    """Fetch a LinkedIn description over plain HTTP from the guest
+    job-posting endpoint. None when the URL has no job ID or the page has no
+    description, so the caller can fall back to the browser."""
+    job_id = _extract_linkedin_job_id(job_url)
+    if not job_id:
+        return None
+    try:
+        resp = await get_with_backoff(client, _GUEST_POSTING_URL.format(job_id), _linkedin_limiter)
+        resp.raise_for_status()
+        return _description_from_guest_html(resp.text)
+    except Exception as e:
+        print(f"    ⚠️  Guest description fetch failed: {e}")
+        return None
+
+
 async def get_job_description(page, job_url):
     """
     Visit LinkedIn's public guest job-posting endpoint and extract the description.
@@ -265,24 +379,19 @@ async def get_job_description(page, job_url):
     """
     try:
         job_id = _extract_linkedin_job_id(job_url)
-        target_url = (
-            f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
-            if job_id else job_url
-        )
+        target_url = _GUEST_POSTING_URL.format(job_id) if job_id else job_url
 
         await page.goto(target_url, wait_until="domcontentloaded", timeout=20000)
-        await asyncio.sleep(1)
+        # Proceed as soon as the description renders; the old fixed 1s sleep
+        # is now only the worst case (unexpected layouts).
+        try:
+            await page.wait_for_selector(_DESCRIPTION_SELECTOR, state="attached", timeout=1000)
+        except Exception:
+            pass
 
-        elem = await page.query_selector(
-            ".show-more-less-html__markup, .description__text, section.description"
+        description = await page.evaluate(
+            _READ_DESCRIPTION_JS, [_DESCRIPTION_SELECTOR, MIN_DESCRIPTION_LEN]
         )
-        description = await elem.inner_text() if elem else None
-
-        if not description or len(description) < 80:
-            # Last-ditch fallback for non-LinkedIn or unexpected layouts
-            elem = await page.query_selector("main, article")
-            description = await elem.inner_text() if elem else None
-
         return description[:10000] if description else None
 
     except Exception as e:
@@ -290,235 +399,471 @@ async def get_job_description(page, job_url):
         return None
 
 
+# Reposts and multi-location listings often carry word-for-word identical
+# descriptions. LLM results are keyed by a digest of their inputs, so each
+# distinct text is sent once per run; concurrent callers share the in-flight
+# task. Cleared at the end of main() (the tasks belong to its event loop).
+_llm_memo = {}
+
+
+def _memo_digest(*parts):
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.digest()
+
+
+def _memoized(kind, make, *inputs):
+    key = (kind, _memo_digest(*inputs))
+    task = _llm_memo.get(key)
+    if task is None:
+        if len(_llm_memo) >= LLM_MEMO_MAX:
+            _llm_memo.clear()
+        task = _llm_memo[key] = asyncio.ensure_future(make(*inputs))
+    return task
+
+
 async def _analyze_one(job, description, resume_text):
-    """Run AI analysis on a single job's description and persist it."""
-    analysis = analyze_job(description)
+    """Run AI analysis on a single job's description and persist it.
+
+    Summary and match score are requested concurrently on the async LLM
+    client (memoized per run on the exact inputs); the supabase client is
+    blocking, so the update runs in a thread."""
+    analysis_task = _memoized("analysis", analyze_job_async, description)
+    if resume_text:
+        analysis, match = await asyncio.gather(
+            analysis_task,
+            _memoized("match", score_job_match_async, description, resume_text),
+        )
+    else:
+        analysis, match = await analysis_task, None
     update_data = {
         "description": description,
         "ai_summary": analysis.get("summary"),
         "ai_requirements": analysis.get("requirements"),
     }
-    if resume_text:
-        match = score_job_match(description, resume_text)
+    if match:
         update_data["match_score"] = match["score"]
         update_data["match_reasoning"] = match["reasoning"]
-    supabase.table("jobs").update(update_data).eq("id", job["id"]).execute()
+    query = supabase.table("jobs").update(update_data).eq("id", job["id"])
+    await asyncio.to_thread(query.execute)
 
 
-async def analyze_new_jobs(user_id, jobs_data):
+async def analyze_new_jobs(user_id, jobs_data, browser):
     """Run AI analysis on new jobs. Jobs that already carry a description
-    (Greenhouse/Lever) skip the Playwright fetch entirely."""
+    (Greenhouse/Lever) skip the fetch entirely.
+
+    Up to AI_CONCURRENCY jobs are analyzed at once. LinkedIn descriptions come
+    from the guest job-posting endpoint over plain HTTP; only the ones it
+    can't serve are fetched by FETCH_BATCH browser tabs pulling from a shared
+    queue. Either way, one job's fetch overlaps another's LLM calls.
+    """
     if not jobs_data:
         return
 
-    profile_resp = supabase.table("profiles").select("resume_text").eq("id", user_id).single().execute()
+    profile_query = supabase.table("profiles").select("resume_text").eq("id", user_id).single()
+    profile_resp = await asyncio.to_thread(profile_query.execute)
     resume_text = (profile_resp.data or {}).get("resume_text") or ""
 
     print(f"  🤖 Running AI analysis on {len(jobs_data)} new jobs...")
 
     with_desc = [j for j in jobs_data if (j.get("description") or "").strip()]
     needs_fetch = [j for j in jobs_data if not (j.get("description") or "").strip()]
-    analyzed = 0
+    ai_slots = asyncio.Semaphore(AI_CONCURRENCY)
+
+    async def analyze(job, description, label="Analyzing"):
+        if len(description.strip()) < MIN_DESCRIPTION_LEN:
+            # A stub like "See website" — nothing for the LLM to summarize.
+            print(f"    ⏭️  Skipping (description too short): {job['title'][:30]}")
+            return False
+        async with ai_slots:
+            try:
+                print(f"    📝 {label}: {job['title'][:30]}...")
+                await _analyze_one(job, description, resume_text)
+                return True
+            except Exception as e:
+                print(f"    ⚠️  Error analyzing job: {e}")
+                return False
 
-    # Jobs that already have a description (API-sourced) — no browser needed.
-    for job in with_desc:
+    async def analyze_cached():
+        # Jobs that already have a description (API-sourced) — no browser needed.
+        done = await asyncio.gather(
+            *(analyze(job, job["description"], "Analyzing (cached desc)") for job in with_desc)
+        )
+        return sum(done)
+
+    async def fetch_and_analyze():
+        # Jobs that need their description scraped (LinkedIn) — plain HTTP first.
+        if not needs_fetch:
+            return 0
+        leftovers = []
+        headers = {"User-Agent": random_user_agent(), "Accept-Language": "en-US,en;q=0.9"}
+        async with http_client(headers=headers, follow_redirects=True) as client:
+            async def via_guest(job):
+                description = await fetch_job_description(client, job["url"])
+                if not description:
+                    leftovers.append(job)
+                    return 0
+                return await analyze(job, description)
+
+            done = sum(await asyncio.gather(*(via_guest(job) for job in needs_fetch)))
+        return done + await fetch_with_browser(leftovers)
+
+    async def fetch_with_browser(jobs):
+        # Whatever the guest endpoint couldn't serve — use the shared browser.
+        if not jobs:
+            return 0
+        queue = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+
+        async def worker(page):
+            # The tab moves on to its next job while the LLM works on this
+            # one, so page loads and pauses overlap the analysis.
+            analyses = []
+            while not queue.empty():
+                job = queue.get_nowait()
+                description = await get_job_description(page, job["url"])
+                if not description:
+                    print(f"    ⚠️  No description found for: {job['title'][:30]}")
+                else:
+                    analyses.append(asyncio.create_task(analyze(job, description)))
+                await human_delay(1, 3)
+            return sum(await asyncio.gather(*analyses))
+
+        context = await (await browser.get()).new_context(
+            extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
+            user_agent=(
+                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+            ),
+        )
         try:
-            print(f"    📝 Analyzing (cached desc): {job['title'][:30]}...")
-            await _analyze_one(job, job["description"], resume_text)
-            analyzed += 1
-        except Exception as e:
-            print(f"    ⚠️  Error analyzing job: {e}")
-
-    # Jobs that need their description scraped (LinkedIn) — launch one browser.
-    if needs_fetch:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
-                ),
-            )
-            page = await context.new_page()
-            for job in needs_fetch:
+            await context.route("**/*", _block_heavy_resources)
+            pages = [await context.new_page() for _ in range(min(FETCH_BATCH, len(jobs)))]
+            done = await asyncio.gather(*(worker(page) for page in pages))
+        finally:
+            await context.close()
+        return sum(done)
+
+    analyzed = sum(await asyncio.gather(analyze_cached(), fetch_and_analyze()))
+
+    print(f"  ✅ AI analysis complete: {analyzed} jobs analyzed")
+
+
+# Pulls the raw text of every job card on a search-results page in a single
+# CDP round trip; parsed in Python by _job_from_card.
+_READ_CARDS_JS = """
+() => Array.from(document.querySelectorAll('.job-search-card')).map(c => {
+    const text = sel => { const el = c.querySelector(sel); return el ? el.innerText : null; };
+    const link = c.querySelector('a.base-card__full-link');
+    return {
+        title: text('.base-search-card__title'),
+        company: text('.base-search-card__subtitle'),
+        location: text('.job-search-card__location'),
+        href: link ? link.getAttribute('href') : null,
+        metadata: text('.base-search-card__metadata'),
+        posted: text('.job-search-card__listdate'),
+    };
+})
+"""
+
+
+def _job_from_card(card, now=None):
+    """Build a job dict from one card's raw fields (_READ_CARDS_JS or
+    _cards_from_guest_html), or None if the card is missing its basic fields."""
+    if any(card[field] is None for field in ("title", "company", "location", "href")):
+        return None
+
+    title = card["title"].strip()
+    company = card["company"].strip()
+    job_location = card["location"].strip()
+    job_url = card["href"].split("?")[0] if card["href"] else None
+
+    # Enhanced fields - try to extract from metadata
+    # LinkedIn changed selectors - use base-search-card__metadata
+    metadata_text = card["metadata"] or ""
+
+    # Try to get posted date - check both the listdate element AND metadata
+    posted_text = card["posted"] or ""
+
+    # If not in listdate, try to extract from metadata text
+    if not posted_text and metadata_text:
+        # Look for patterns like "2 days ago", "1 week ago" in metadata
+        match = _POSTED_AGO_RE.search(metadata_text)
+        if match:
+            posted_text = match.group(1)
+
+    job_type, experience_level = classify_metadata(metadata_text)
+
+    return {
+        "title": title,
+        "company": company,
+        "location": job_location,
+        "url": job_url,
+        "job_hash": job_hash(title, company, job_location),
+        "source": "linkedin",
+        # Salary, applicants and easy-apply aren't on the cards - they
+        # require clicking into the job
+        "salary_min": None,
+        "salary_max": None,
+        "salary_currency": None,
+        "job_type": job_type,
+        "experience_level": experience_level,
+        # Try to get work type from location (remote/hybrid keywords)
+        "work_type": extract_work_type(job_location),
+        "posted_date": extract_posted_date(posted_text, now),
+        "applicants_count": None,
+        "easy_apply": False,
+    }
+
+
+async def _scrape_search_page(context, sem, keywords, location, page_num):
+    """Scrape one LinkedIn search-results page in its own tab."""
+    start = page_num * 25
+    url = (
+        f"https://www.linkedin.com/jobs/search/?"
+        f"keywords={quote_plus(keywords)}&"
+        f"location={quote_plus(location)}&"
+        f"start={start}"
+    )
+    jobs = []
+
+    async with sem:
+        print(f"  🔍 Page {page_num + 1}: {url}")
+        page = await context.new_page()
+        try:
+            # Navigate with human-like delay first (also staggers the tabs)
+            await human_delay(1, 3)
+            # Cards are server-rendered: no need to wait for the network to go quiet
+            await page.goto(url, wait_until="domcontentloaded", timeout=45000)
+
+            # Human-like scroll after page load
+            await human_scroll(page)
+
+            # The cards only need to be in the DOM for evaluate() to read them.
+            await page.wait_for_selector(".job-search-card", state="attached", timeout=15000)
+
+            # Read every card's fields in one evaluate() instead of a
+            # query_selector/inner_text round trip per field per card.
+            cards = await page.evaluate(_READ_CARDS_JS)
+            now = datetime.now()  # one reference time for the page's "N days ago"
+
+            for card in cards:
                 try:
-                    description = await get_job_description(page, job["url"])
-                    if not description:
-                        print(f"    ⚠️  No description found for: {job['title'][:30]}")
-                        continue
-                    print(f"    📝 Analyzing: {job['title'][:30]}...")
-                    await _analyze_one(job, description, resume_text)
-                    analyzed += 1
-                    await human_delay(1, 3)
+                    job = _job_from_card(card, now)
+                    if job:
+                        jobs.append(job)
                 except Exception as e:
-                    print(f"    ⚠️  Error analyzing job: {e}")
+                    print(f"    ⚠️  Error parsing job card: {e}")
                     continue
-            await browser.close()
 
-    print(f"  ✅ AI analysis complete: {analyzed} jobs analyzed")
+        except Exception as e:
+            print(f"    ❌ Error on page {page_num + 1}: {e}")
+        finally:
+            await page.close()
 
+    return jobs
 
-async def scrape_linkedin_jobs(keywords, location, pages=1):
-    """Scrape LinkedIn jobs using Playwright with human-like behavior"""
+
+# LinkedIn's public guest search endpoint: the same job cards the search page
+# renders, as a plain HTML fragment, 25 per `start` offset. No JS needed.
+_GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+# Shared by every concurrent search so together they stay under LinkedIn's
+# rate limit; 429s push everyone back by the server's Retry-After.
+_linkedin_limiter = RateLimiter(LINKEDIN_MIN_INTERVAL)
+
+
+def _cards_from_guest_html(html):
+    """Raw card fields (same shape as _READ_CARDS_JS) from a guest-endpoint page."""
+    cards = []
+    for node in LexborHTMLParser(html).css(".job-search-card"):
+        def text(selector):
+            el = node.css_first(selector)
+            return el.text(separator=" ", strip=True) if el else None
+
+        link = node.css_first("a.base-card__full-link")
+        cards.append({
+            "title": text(".base-search-card__title"),
+            "company": text(".base-search-card__subtitle"),
+            "location": text(".job-search-card__location"),
+            "href": link.attributes.get("href") if link else None,
+            "metadata": text(".base-search-card__metadata"),
+            "posted": text(".job-search-card__listdate"),
+        })
+    return cards
+
+
+async def _scrape_linkedin_guest(keywords, location, pages=1):
+    """Fetch search-result pages from the guest endpoint with plain HTTP."""
+    headers = {"User-Agent": random_user_agent(), "Accept-Language": "en-US,en;q=0.9"}
+    async with http_client(headers=headers, follow_redirects=True) as client:
+        async def fetch(page_num):
+            print(f"  🔍 Page {page_num + 1} (guest API)")
+            resp = await get_with_backoff(client, _GUEST_SEARCH_URL, _linkedin_limiter, params={
+                "keywords": keywords, "location": location, "start": page_num * 25,
+            })
+            resp.raise_for_status()
+            return _cards_from_guest_html(resp.text)
+
+        results = await asyncio.gather(*(fetch(n) for n in range(pages)), return_exceptions=True)
+
+    now = datetime.now()  # one reference time for every card's "N days ago"
     jobs = []
+    for page_num, cards in enumerate(results):
+        if isinstance(cards, Exception):
+            print(f"    ❌ Error on page {page_num + 1}: {cards}")
+            continue
+        for card in cards:
+            try:
+                job = _job_from_card(card, now)
+                if job:
+                    jobs.append(job)
+            except Exception as e:
+                print(f"    ⚠️  Error parsing job card: {e}")
+    return jobs
 
-    async with async_playwright() as p:
-        # Launch browser with stealth settings
-        browser = await p.chromium.launch(
-            headless=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage",
-            ]
-        )
 
-        # Use random user agent and viewport
-        ua = random_user_agent()
-        vp = random_viewport()
+async def scrape_linkedin_jobs(keywords, location, pages, browser):
+    """Scrape LinkedIn jobs: the guest endpoint over HTTP, falling back to a
+    full browser only when it comes back empty (blocked or markup changed)."""
+    try:
+        jobs = await _scrape_linkedin_guest(keywords, location, pages)
+    except Exception as e:
+        print(f"    ⚠️  LinkedIn guest API failed: {e}")
+        jobs = []
+    if jobs:
+        return jobs
 
-        context = await browser.new_context(
-            user_agent=ua,
-            viewport=vp,
-            locale="en-US",
-            timezone_id="America/New_York",
-        )
+    print("    ↪️  No jobs from the guest API, falling back to the browser")
+    return await _scrape_linkedin_browser(keywords, location, pages, browser)
 
-        # Inject stealth scripts to hide automation
-        await context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-            window.chrome = { runtime: {} };
-        """)
 
-        page = await context.new_page()
+# Concurrent searches (SCRAPE_CONCURRENCY) share one state file. A thread
+# lock rather than an asyncio one: /scrape-now re-runs the scraper on a fresh
+# event loop in the same process, and an asyncio.Lock stays bound to its first.
+_storage_state_lock = threading.Lock()
 
-        for page_num in range(pages):
-            start = page_num * 25
-            url = (
-                f"https://www.linkedin.com/jobs/search/?"
-                f"keywords={quote_plus(keywords)}&"
-                f"location={quote_plus(location)}&"
-                f"start={start}"
-            )
 
-            print(f"  🔍 Page {page_num + 1}: {url}")
+def _load_storage_state(path):
+    """Saved browser state as a dict, or None when unset, missing or
+    unreadable — a bad file just means starting a fresh session."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError) as e:
+        print(f"    ⚠️  Ignoring unreadable browser state {path}: {e}")
+        return None
 
-            try:
-                # Navigate with human-like delay first
-                await human_delay(1, 3)
-                await page.goto(url, wait_until="networkidle", timeout=45000)
-
-                # Human-like scroll after page load
-                await human_scroll(page)
-
-                await page.wait_for_selector(".job-search-card", timeout=15000)
-
-                job_cards = await page.query_selector_all(".job-search-card")
-
-                for card in job_cards:
-                    try:
-                        # Basic fields
-                        title_elem = await card.query_selector(".base-search-card__title")
-                        company_elem = await card.query_selector(".base-search-card__subtitle")
-                        location_elem = await card.query_selector(".job-search-card__location")
-                        link_elem = await card.query_selector("a.base-card__full-link")
-
-                        if not all([title_elem, company_elem, location_elem, link_elem]):
-                            continue
-
-                        title = (await title_elem.inner_text()).strip()
-                        company = (await company_elem.inner_text()).strip()
-                        job_location = (await location_elem.inner_text()).strip()
-                        job_url = await link_elem.get_attribute("href")
-                        job_url = job_url.split("?")[0] if job_url else None
-
-                        # Enhanced fields - try to extract from metadata
-                        # LinkedIn changed selectors - use base-search-card__metadata
-                        metadata_elem = await card.query_selector(".base-search-card__metadata")
-                        metadata_text = await metadata_elem.inner_text() if metadata_elem else ""
-
-                        # Try to get posted date - check both the listdate element AND metadata
-                        posted_elem = await card.query_selector(".job-search-card__listdate")
-                        posted_text = await posted_elem.inner_text() if posted_elem else ""
-
-                        # If not in listdate, try to extract from metadata text
-                        if not posted_text and metadata_text:
-                            # Look for patterns like "2 days ago", "1 week ago" in metadata
-                            import re
-                            match = re.search(r'(\d+\s*(?:day|week|hour|minute|month)s?\s*ago)', metadata_text, re.IGNORECASE)
-                            if match:
-                                posted_text = match.group(1)
-
-                        posted_date = extract_posted_date(posted_text)
-
-                        # Try to get work type from location (remote/hybrid keywords)
-                        work_type = extract_work_type(job_location)
-
-                        # Salary not available on job cards anymore - requires clicking into job
-                        salary_min = None
-                        salary_max = None
-                        salary_currency = None
-
-                        # Job type - extract from metadata if present
-                        job_type = extract_job_type(metadata_text)
-
-                        # Experience level - extract from metadata if present
-                        experience_level = extract_experience_level(metadata_text)
-
-                        # Applicants - not available on card
-                        applicants_count = None
-
-                        # Easy apply - not available on card
-                        easy_apply = False
-
-                        job_hash = generate_job_hash(title, company, job_location)
-
-                        jobs.append({
-                            "title": title,
-                            "company": company,
-                            "location": job_location,
-                            "url": job_url,
-                            "job_hash": job_hash,
-                            "source": "linkedin",
-                            # New enhanced fields
-                            "salary_min": salary_min,
-                            "salary_max": salary_max,
-                            "salary_currency": salary_currency,
-                            "job_type": job_type,
-                            "experience_level": experience_level,
-                            "work_type": work_type,
-                            "posted_date": posted_date,
-                            "applicants_count": applicants_count,
-                            "easy_apply": easy_apply,
-                        })
-                    except Exception as e:
-                        print(f"    ⚠️  Error parsing job card: {e}")
-                        continue
-
-                # Human-like delay between pages
-                await human_delay(2, 5)
 
+def _write_storage_state(path, state):
+    # Write-then-rename so a reader never sees a half-written file
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with _storage_state_lock:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(state))
+        os.replace(tmp, path)
+
+
+async def _save_storage_state(context, path):
+    state = await context.storage_state()
+    await asyncio.to_thread(_write_storage_state, path, state)
+
+
+async def _scrape_linkedin_browser(keywords, location, pages, browser):
+    """Scrape LinkedIn jobs using Playwright with human-like behavior"""
+    # Use random user agent and viewport
+    ua = random_user_agent()
+    vp = random_viewport()
+
+    state = LINKEDIN_STORAGE_STATE
+    context = await (await browser.get()).new_context(
+        user_agent=ua,
+        viewport=vp,
+        locale="en-US",
+        timezone_id="America/New_York",
+        storage_state=_load_storage_state(state),
+    )
+    try:
+        await context.route("**/*", _block_heavy_resources)
+
+        # Inject stealth scripts to hide automation
+        await context.add_init_script(_STEALTH_JS)
+
+        # Result pages load concurrently, a few tabs at a time, instead of
+        # one after another with a pause in between.
+        sem = asyncio.Semaphore(LINKEDIN_PAGE_CONCURRENCY)
+        results = await asyncio.gather(
+            *(_scrape_search_page(context, sem, keywords, location, n) for n in range(pages))
+        )
+    finally:
+        if state:
+            try:
+                await _save_storage_state(context, state)
             except Exception as e:
-                print(f"    ❌ Error on page {page_num + 1}: {e}")
-                continue
+                print(f"    ⚠️  Could not save browser state: {e}")
+        await context.close()
+
+    return [job for page_jobs in results for job in page_jobs]
+
+
+def _job_row(user_id, job):
+    """jobs-table row for a scraped job. Greenhouse/Lever bring their own
+    description; LinkedIn jobs have none yet (filled later by analyze_new_jobs)."""
+    return {
+        "user_id": user_id,
+        "title": job["title"],
+        "company": job["company"],
+        "location": job["location"],
+        "url": job["url"],
+        "job_hash": job["job_hash"],
+        "source": job["source"],
+        "status": "New",
+        "description": job.get("description"),
+        # New enhanced fields
+        "salary_min": job.get("salary_min"),
+        "salary_max": job.get("salary_max"),
+        "salary_currency": job.get("salary_currency"),
+        "job_type": job.get("job_type"),
+        "experience_level": job.get("experience_level"),
+        "work_type": job.get("work_type"),
+        "posted_date": job.get("posted_date"),
+        "applicants_count": job.get("applicants_count"),
+        "easy_apply": job.get("easy_apply"),
+    }
 
-        await browser.close()
 
-    return jobs
+# board → (log icon, display name)
+_BOARDS = {
+    "linkedin": ("🔗", "LinkedIn"),
+    "greenhouse": ("🌱", "Greenhouse"),
+    "lever": ("🎚️ ", "Lever"),
+}
+
 
+async def _scrape_board(board, keywords, location, pages, browser):
+    if board == "linkedin":
+        return await scrape_linkedin_jobs(keywords, location, pages, browser)
+    if board == "greenhouse":
+        from scrapers.greenhouse import scrape as scrape_greenhouse
+        return await scrape_greenhouse(keywords, location, pages)
+    if board == "lever":
+        from scrapers.lever import scrape as scrape_lever
+        return await scrape_lever(keywords, location, pages)
+    return []
 
-async def scrape_for_user(user_id, config):
-    """Scrape jobs for a single user configuration across all selected boards."""
+
+async def scrape_for_user(user_id, config, browser):
+    """Scrape jobs for a single user configuration across all selected boards.
+
+    Boards are scraped concurrently and each one's results are queued for a
+    single writer, which saves them while the slower boards are still
+    running. AI analysis starts once every new row is in.
+    """
     boards = config.get("boards") or ["linkedin"]
     print(f"\n👤 User: {user_id}")
     print(f"   Keywords: {config['keywords']}")
@@ -530,102 +875,67 @@ async def scrape_for_user(user_id, config):
     location = config["location"]
     pages = config["pages"]
 
-    jobs = []
-
-    if "linkedin" in boards:
-        try:
-            li = await scrape_linkedin_jobs(keywords, location, pages)
-            print(f"  🔗 LinkedIn: {len(li)} jobs")
-            jobs.extend(li)
-        except Exception as e:
-            print(f"  ❌ LinkedIn failed: {e}")
+    queue = asyncio.Queue()
+    found = 0
 
-    if "greenhouse" in boards:
+    async def produce(board):
+        nonlocal found
+        icon, name = _BOARDS[board]
         try:
-            from scrapers.greenhouse import scrape as scrape_greenhouse
-            gh = await scrape_greenhouse(keywords, location, pages)
-            print(f"  🌱 Greenhouse: {len(gh)} jobs")
-            jobs.extend(gh)
+            jobs = await _scrape_board(board, keywords, location, pages, browser)
         except Exception as e:
-            print(f"  ❌ Greenhouse failed: {e}")
+            print(f"  ❌ {name} failed: {e}")
+            return
+        print(f"  {icon} {name}: {len(jobs)} jobs")
+        found += len(jobs)
+        if jobs:
+            await queue.put(jobs)
+
+    async def write():
+        # The same posting often shows up on overlapping result pages or on
+        # more than one board; keep the first copy of each job_hash.
+        seen_hashes = set()
+        inserted = []
+        while (jobs := await queue.get()) is not None:
+            rows = []
+            for job in jobs:
+                if job["job_hash"] not in seen_hashes:
+                    seen_hashes.add(job["job_hash"])
+                    rows.append(_job_row(user_id, job))
+            if not rows:
+                continue
+            # One round trip per batch. The (user_id, job_hash) unique index
+            # (docs/migrations/004) makes Postgres skip jobs we already have,
+            # and only the newly inserted rows come back.
+            query = supabase.table("jobs").upsert(rows, on_conflict="user_id,job_hash", ignore_duplicates=True)
+            try:
+                resp = await asyncio.to_thread(query.execute)
+            except Exception as e:
+                print(f"  ❌ Database error: {e}")
+                continue
+            inserted.extend(resp.data or [])
+        return inserted
 
-    if "lever" in boards:
-        try:
-            from scrapers.lever import scrape as scrape_lever
-            lv = await scrape_lever(keywords, location, pages)
-            print(f"  🎚️  Lever: {len(lv)} jobs")
-            jobs.extend(lv)
-        except Exception as e:
-            print(f"  ❌ Lever failed: {e}")
+    writer = asyncio.create_task(write())
+    await asyncio.gather(*(produce(board) for board in boards if board in _BOARDS))
+    await queue.put(None)
+    new_job_list = await writer
 
-    if not jobs:
+    if not found:
         print(f"  ⚠️  No jobs found")
         return 0
 
-    print(f"  📦 Found {len(jobs)} jobs total")
-    
-    # Save to database using Supabase client
-    new_jobs = 0
-    
-    try:
-        for job in jobs:
-            # Check if job already exists
-            existing = supabase.table("jobs")\
-                .select("id")\
-                .eq("job_hash", job["job_hash"])\
-                .eq("user_id", user_id)\
-                .execute()
-            
-            if existing.data:
-                continue  # Skip duplicate
-            
-            # Insert new job. Greenhouse/Lever bring their own description;
-            # LinkedIn jobs have none yet (filled later by analyze_new_jobs).
-            supabase.table("jobs").insert({
-                "user_id": user_id,
-                "title": job["title"],
-                "company": job["company"],
-                "location": job["location"],
-                "url": job["url"],
-                "job_hash": job["job_hash"],
-                "source": job["source"],
-                "status": "New",
-                "description": job.get("description"),
-                # New enhanced fields
-                "salary_min": job.get("salary_min"),
-                "salary_max": job.get("salary_max"),
-                "salary_currency": job.get("salary_currency"),
-                "job_type": job.get("job_type"),
-                "experience_level": job.get("experience_level"),
-                "work_type": job.get("work_type"),
-                "posted_date": job.get("posted_date"),
-                "applicants_count": job.get("applicants_count"),
-                "easy_apply": job.get("easy_apply"),
-            }).execute()
-
-            new_jobs += 1
-
-        print(f"  ✅ Saved {new_jobs} new jobs")
-
-        # Run AI analysis on new jobs - if we have new jobs, fetch their IDs
-        if new_jobs > 0:
-            # Get only the newly inserted jobs with their IDs
-            new_job_list = []
-            for job in jobs:
-                existing = supabase.table("jobs").select("id, title, url, description").eq("job_hash", job["job_hash"]).eq("user_id", user_id).eq("status", "New").execute()
-                if existing.data:
-                    new_job_list.append(existing.data[0])
-
-            print(f"  🤖 Running AI analysis on {len(new_job_list)} new jobs...")
+    print(f"  📦 Found {found} jobs total")
+    print(f"  ✅ Saved {len(new_job_list)} new jobs")
 
-            # Run AI analysis
-            if new_job_list:
-                await analyze_new_jobs(user_id, new_job_list)
+    # Run AI analysis on the rows just inserted (they carry their IDs)
+    if new_job_list:
+        try:
+            await analyze_new_jobs(user_id, new_job_list, browser)
+        except Exception as e:
+            print(f"  ❌ AI analysis failed: {e}")
 
-    except Exception as e:
-        print(f"  ❌ Database error: {e}")
-    
-    return new_jobs
+    return len(new_job_list)
 
 
 async def main():
@@ -637,10 +947,10 @@ async def main():
     
     try:
         # Get active search configs
-        response = supabase.table("search_configs")\
+        query = supabase.table("search_configs")\
             .select("id, user_id, keywords, location, pages, boards")\
-            .eq("is_active", True)\
-            .execute()
+            .eq("is_active", True)
+        response = await asyncio.to_thread(query.execute)
         
         configs = response.data
         
@@ -651,17 +961,27 @@ async def main():
         print(f"\n📋 Found {len(configs)} active search configuration(s)")
         print("-" * 60)
         
-        total_new_jobs = 0
-        
-        for config in configs:
-            try:
-                new_jobs = await scrape_for_user(config["user_id"], config)
-                total_new_jobs += new_jobs
-                await asyncio.sleep(SCRAPE_DELAY)
-            except Exception as e:
-                print(f"  ❌ Error: {str(e)}")
-                continue
-        
+        # Configs are independent — scrape several at once instead of
+        # back to back, all on one shared browser.
+        sem = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+        browser = SharedBrowser()
+
+        async def run_config(config):
+            async with sem:
+                try:
+                    return await scrape_for_user(config["user_id"], config, browser)
+                except Exception as e:
+                    print(f"  ❌ Error: {str(e)}")
+                    return 0
+
+        try:
+            results = await asyncio.gather(*(run_config(config) for config in configs))
+        finally:
+            await browser.close()
+            _llm_memo.clear()
+            await aclose_async_clients()
+        total_new_jobs = sum(results)
+
         print("\n" + "=" * 60)
         print(f"✅ SCRAPING COMPLETE")
         print(f"📊 Total new jobs saved: {total_new_jobs}")
@@ -673,6 +993,15 @@ async def main():
         raise
 
 
+def run():
+    """Run main() to completion on its own event loop — uvloop when installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main())
+    return uvloop.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
 
@@ -1,7 +1,7 @@
 """
 Job-board scrapers.
 
-LinkedIn lives in the top-level scraper.py (Playwright-based, unchanged).
+LinkedIn lives in the top-level scraper.py (guest endpoint + Playwright).
 This package holds the API-based boards: Greenhouse and Lever, both free
 public JSON APIs with no auth and no anti-bot.
 
@@ -12,3 +12,80 @@ returning job dicts shaped like the LinkedIn scraper's output, plus a
 `description` key (these APIs return the full description inline, so the
 analysis step does not need to re-fetch it).
 """
+
+import asyncio
+import functools
+import hashlib
+import time
+from typing import Optional
+
+import httpx
+
+
+@functools.lru_cache(maxsize=4096)
+def job_hash(title, company, location) -> int:
+    """Dedup key for a job, shared by every board so the same posting found
+    on two boards collides: the first 8 bytes of the MD5 as a signed 64-bit
+    int, stored in a bigint column. Postgres can derive the same value from
+    md5() (see docs/migrations/006). Cached: the same posting recurs across
+    result pages, boards and users in one run."""
+    key = f"{title}_{company}_{location}".lower()
+    digest = hashlib.md5(key.encode(), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def http_client(**kwargs) -> httpx.AsyncClient:
+    """Pooled HTTP/2 client for a whole board sweep: requests to the same
+    host share one TLS connection instead of a handshake each."""
+    kwargs.setdefault("timeout", 15)
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=30.0),
+        **kwargs,
+    )
+
+
+class RateLimiter:
+    """Keeps requests to one host at least `interval` seconds apart.
+
+    Sleeps only for whatever is left of the interval since the previous
+    request, so a slow response eats into the wait instead of adding to it.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_allowed = 0.0
+
+    async def wait(self) -> None:
+        # Reserve the next slot before sleeping (no await in between), so
+        # concurrent callers queue up one interval apart without a lock.
+        now = time.monotonic()
+        slot = max(now, self._next_allowed)
+        self._next_allowed = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def defer(self, seconds: float) -> None:
+        """Hold every caller off for `seconds` (e.g. after a 429)."""
+        self._next_allowed = max(self._next_allowed, time.monotonic() + seconds)
+
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    """Seconds from a numeric Retry-After header, if the server sent one."""
+    try:
+        return float(resp.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+
+async def get_with_backoff(client: httpx.AsyncClient, url: str, limiter: RateLimiter,
+                           attempts: int = 4, max_wait: float = 30.0, **kwargs) -> httpx.Response:
+    """GET through `limiter`, retrying 429/5xx with the server's Retry-After
+    or exponential backoff. Returns the last response either way."""
+    for attempt in range(attempts):
+        await limiter.wait()
+        resp = await client.get(url, **kwargs)
+        if resp.status_code != 429 and resp.status_code < 500:
+            return resp
+        limiter.defer(min(max_wait, _retry_after(resp) or 0.5 * 2 ** attempt))
+    return resp
@@ -6,10 +6,12 @@ companies that host their careers page on Greenhouse and filter by keyword.
 Endpoint: https://boards-api.greenhouse.io/v1/boards/{company}/jobs?content=true
 """
 
-import hashlib
+import asyncio
 import re
 import httpx
 
+from scrapers import http_client, job_hash
+
 _API = "https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
 
 # Companies hosting on Greenhouse. Extend freely.
@@ -20,10 +22,7 @@ COMPANY_SLUGS = [
 ]
 
 _TAG_RE = re.compile(r"<[^>]+>")
-
-
-def _job_hash(title: str, company: str, location: str) -> str:
-    return hashlib.sha256(f"{title}_{company}_{location}".lower().encode()).hexdigest()
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
 
 
 def _strip_html(raw: str) -> str:
@@ -34,14 +33,16 @@ def _strip_html(raw: str) -> str:
                .replace("&amp;", "&").replace("&#39;", "'").replace("&quot;", '"')
                .replace("&nbsp;", " "))
     text = _TAG_RE.sub("", text)
-    return re.sub(r"\n{3,}", "\n\n", text).strip()
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
 
 
-async def scrape_company(company_slug: str, keywords: str) -> list[dict]:
+async def scrape_company(company_slug: str, keywords: str, client: httpx.AsyncClient = None) -> list[dict]:
     """Fetch one Greenhouse board and keep jobs whose title matches the keyword."""
+    if client is None:
+        async with http_client() as client:
+            return await scrape_company(company_slug, keywords, client)
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(_API.format(company=company_slug), params={"content": "true"})
+        resp = await client.get(_API.format(company=company_slug), params={"content": "true"})
         if resp.status_code != 200:
             return []
         data = resp.json()
@@ -65,7 +66,7 @@ async def scrape_company(company_slug: str, keywords: str) -> list[dict]:
             "location": loc,
             "url": job_url,
             "description": _strip_html(item.get("content", "")),
-            "job_hash": _job_hash(title, display_company, loc),
+            "job_hash": job_hash(title, display_company, loc),
             "source": "greenhouse",
             "work_type": "Remote" if "remote" in loc.lower() else None,
         })
@@ -74,7 +75,7 @@ async def scrape_company(company_slug: str, keywords: str) -> list[dict]:
 
 async def scrape(keywords: str, location: str = "", pages: int = 1) -> list[dict]:
     """Sweep every curated Greenhouse company. location/pages are ignored."""
-    all_jobs: list[dict] = []
-    for slug in COMPANY_SLUGS:
-        all_jobs.extend(await scrape_company(slug, keywords))
-    return all_jobs
+    # All boards at once over one pooled client (same API host → one connection).
+    async with http_client() as client:
+        results = await asyncio.gather(*(scrape_company(slug, keywords, client) for slug in COMPANY_SLUGS))
+    return [job for jobs in results for job in jobs]
@@ -6,9 +6,11 @@ companies hosting on Lever and filter by keyword.
 Endpoint: https://api.lever.co/v0/postings/{company}?mode=json
 """
 
-import hashlib
+import asyncio
 import httpx
 
+from scrapers import http_client, job_hash
+
 _API = "https://api.lever.co/v0/postings/{company}"
 
 # Companies hosting on Lever. Extend freely.
@@ -19,15 +21,13 @@ COMPANY_SLUGS = [
 ]
 
 
-def _job_hash(title: str, company: str, location: str) -> str:
-    return hashlib.sha256(f"{title}_{company}_{location}".lower().encode()).hexdigest()
-
-
-async def scrape_company(company_slug: str, keywords: str) -> list[dict]:
+async def scrape_company(company_slug: str, keywords: str, client: httpx.AsyncClient = None) -> list[dict]:
     """Fetch one Lever board and keep jobs whose title matches the keyword."""
+    if client is None:
+        async with http_client() as client:
+            return await scrape_company(company_slug, keywords, client)
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(_API.format(company=company_slug), params={"mode": "json"})
+        resp = await client.get(_API.format(company=company_slug), params={"mode": "json"})
         if resp.status_code != 200:
             return []
         data = resp.json()
@@ -51,7 +51,7 @@ async def scrape_company(company_slug: str, keywords: str) -> list[dict]:
             "location": loc,
             "url": job_url,
             "description": (item.get("descriptionPlain") or "").strip(),
-            "job_hash": _job_hash(title, display_company, loc),
+            "job_hash": job_hash(title, display_company, loc),
             "source": "lever",
             "work_type": "Remote" if "remote" in loc.lower() else None,
         })
@@ -60,7 +60,7 @@ async def scrape_company(company_slug: str, keywords: str) -> list[dict]:
 
 async def scrape(keywords: str, location: str = "", pages: int = 1) -> list[dict]:
     """Sweep every curated Lever company. location/pages are ignored."""
-    all_jobs: list[dict] = []
-    for slug in COMPANY_SLUGS:
-        all_jobs.extend(await scrape_company(slug, keywords))
-    return all_jobs
+    # All boards at once over one pooled client (same API host → one connection).
+    async with http_client() as client:
+        results = await asyncio.gather(*(scrape_company(slug, keywords, client) for slug in COMPANY_SLUGS))
+    return [job for jobs in results for job in jobs]
@@ -16,4 +16,4 @@ if [ ! -d "venv" ]; then
 fi
 
 # Start the server
-./venv/bin/python run.py
+./venv/bin/python run.py --dev
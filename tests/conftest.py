@@ -21,4 +21,52 @@ def mock_supabase():
 
 @pytest.fixture
 def mock_current_user():
-    return {"id": "test-user-uuid", "email": "test@example.com", "user_metadata": {"username": "testuser"}}
+    """Same shape the login route stores in the session."""
+    return {"id": "test-user-uuid", "email": "test@example.com", "username": "testuser"}
+
+
+@pytest.fixture
+def auth_client(mock_current_user):
+    """TestClient signed in as mock_current_user; overrides are cleared afterwards."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app import auth
+
+    async def override_get_current_user():
+        return mock_current_user
+
+    app.dependency_overrides[auth.get_current_user] = override_get_current_user
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+class FakeRedis:
+    """Minimal async stand-in for redis.asyncio.Redis (get/set/delete/expire)."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        value = self.store.get(key)
+        return value.encode() if isinstance(value, str) else value
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.ttls[key] = ex
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+            self.ttls.pop(key, None)
+
+    async def expire(self, key, seconds):
+        if key not in self.store:
+            return False
+        self.ttls[key] = seconds
+        return True
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
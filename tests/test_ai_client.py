@@ -1,5 +1,8 @@
 import json
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
 
 
 class TestAnalyzeJob:
@@ -51,3 +54,49 @@ class TestScoreJobMatch:
         from app.utils.ai_client import score_job_match
         result = score_job_match("", "")
         assert result["score"] == 0
+
+
+class TestAsyncVariants:
+    @pytest.mark.asyncio
+    async def test_analyze_job_async_matches_sync_shape(self):
+        payload = json.dumps({"summary": "A role.", "requirements": ["Go", "", "SQL"]})
+        with patch("app.utils.ai_client._allm_call", new=AsyncMock(return_value=payload)):
+            from app.utils.ai_client import analyze_job_async
+            result = await analyze_job_async("some job")
+
+        assert result == {"summary": "A role.", "requirements": "Go, SQL"}
+
+    @pytest.mark.asyncio
+    async def test_analyze_job_async_falls_back_on_error(self):
+        with patch("app.utils.ai_client._allm_call", new=AsyncMock(side_effect=RuntimeError("boom"))):
+            from app.utils.ai_client import analyze_job_async
+            result = await analyze_job_async("some job")
+
+        assert result == {"summary": "—", "requirements": ""}
+
+    @pytest.mark.asyncio
+    async def test_score_job_match_async(self):
+        payload = json.dumps({"score": "67", "reasoning": "Decent overlap."})
+        with patch("app.utils.ai_client._allm_call", new=AsyncMock(return_value=payload)):
+            from app.utils.ai_client import score_job_match_async
+            result = await score_job_match_async("job desc", "resume text")
+
+        assert result == {"score": 67, "reasoning": "Decent overlap."}
+
+
+class TestAcloseAsyncClients:
+    @pytest.mark.asyncio
+    async def test_closes_gemini_aio_when_supported(self):
+        aio = SimpleNamespace(aclose=AsyncMock())
+        with patch("app.utils.ai_client._gemini_client", SimpleNamespace(aio=aio)):
+            from app.utils import ai_client
+            await ai_client.aclose_async_clients()
+            assert ai_client._gemini_client is None
+        aio.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_tolerates_gemini_without_aclose(self):
+        with patch("app.utils.ai_client._gemini_client", SimpleNamespace(aio=SimpleNamespace())):
+            from app.utils import ai_client
+            await ai_client.aclose_async_clients()
+            assert ai_client._gemini_client is None
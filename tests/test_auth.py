@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import respx
+from supabase import create_client
+
+
+def _signed_in_client(access_token: str):
+    """A real supabase client in the state sign_in_with_password leaves it:
+    the SIGNED_IN auth event swaps the anon key for the user's JWT."""
+    client = create_client("https://test.supabase.co", "test-anon-key")
+    client._listen_to_auth_events("SIGNED_IN", SimpleNamespace(access_token=access_token))
+    return client
+
+
+class TestUserScopedReads:
+    """Reads must carry the signed-in user's JWT, not the anon key, or RLS
+    (auth.uid() = user_id) filters every row out."""
+
+    @respx.mock
+    def test_search_configs_read_sends_user_jwt(self, auth_client):
+        route = respx.get("https://test.supabase.co/rest/v1/search_configs").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        with patch("app.routes.search.supabase", _signed_in_client("user-jwt")):
+            resp = auth_client.get("/search/")
+
+        assert resp.status_code == 200
+        assert route.called
+        assert route.calls.last.request.headers["authorization"] == "Bearer user-jwt"
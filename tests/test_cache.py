@@ -0,0 +1,35 @@
+import pytest
+from unittest.mock import patch
+
+from app.utils import cache
+
+
+class TestPageEtag:
+    @pytest.mark.asyncio
+    async def test_no_etag_without_redis(self):
+        with patch("app.utils.cache.get_redis", return_value=None):
+            assert await cache.page_etag("uid-1", "v1") is None
+
+    @pytest.mark.asyncio
+    async def test_etag_is_stable_until_invalidated(self, fake_redis):
+        redis = fake_redis
+        with patch("app.utils.cache.get_redis", return_value=redis):
+            first = await cache.page_etag("uid-1", "v1")
+            assert first.startswith('W/"')
+            assert await cache.page_etag("uid-1", "v1") == first
+            assert await cache.page_etag("uid-1", "v1", "sort=match") != first
+
+            redis.store["dash:uid-1"] = b"{}"
+            await cache.invalidate_user_pages("uid-1")
+            assert "dash:uid-1" not in redis.store
+            assert await cache.page_etag("uid-1", "v1") != first
+
+
+class TestEtagMatches:
+    def test_matches_one_of_several_tags(self):
+        assert cache.etag_matches('W/"a", W/"b"', 'W/"b"')
+
+    def test_no_match_without_header_or_etag(self):
+        assert not cache.etag_matches(None, 'W/"a"')
+        assert not cache.etag_matches('W/"a"', None)
+        assert not cache.etag_matches('W/"a"', 'W/"b"')
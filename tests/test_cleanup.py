@@ -3,9 +3,10 @@ from app.utils.cleanup import cleanup_stale_jobs, cleanup_total_for_user
 
 
 def _delete_chain(deleted_rows):
-    """Build a mock chain that returns `deleted_rows` from .execute()."""
+    """Build a mock chain whose .execute() reports `deleted_rows` as the
+    exact count, with no row bodies (returning=minimal)."""
     chain = MagicMock()
-    chain.execute.return_value = MagicMock(data=deleted_rows)
+    chain.execute.return_value = MagicMock(data=[], count=len(deleted_rows))
     return chain
 
 
@@ -46,6 +47,7 @@ class TestCleanupStaleJobs:
 
         assert result["breakdown"] == {"new_unviewed": 2, "new_viewed": 1, "ignored": 3}
         assert result["deleted_count"] == 6
+        sb.table.return_value.delete.assert_called_with(count="exact", returning="minimal")
         # Log row inserted once
         log_inserts = sb.table.return_value.insert.call_args_list
         assert len(log_inserts) >= 1
@@ -0,0 +1,126 @@
+from collections import Counter
+from contextlib import ExitStack
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.routes.dashboard import (
+    RECENT_DESCRIPTION_CHARS,
+    _build_dashboard_context,
+    _fetch_active_searches,
+    calculate_level,
+    calculate_streak,
+)
+
+
+class TestCalculateLevel:
+    def test_starts_at_level_one(self):
+        assert calculate_level(0) == (1, 0)
+
+    def test_threshold_reaches_next_level(self):
+        assert calculate_level(4)[0] == 1
+        assert calculate_level(5) == (2, 0)
+
+    def test_progress_within_level(self):
+        # Level 4 spans 20..35
+        assert calculate_level(26) == (4, 40)
+
+    def test_caps_at_max_level(self):
+        level, progress = calculate_level(225)
+        assert level == 10
+        assert progress == 50
+
+
+class TestCalculateStreak:
+    TODAY = date(2026, 3, 10)
+
+    def test_no_applications(self):
+        assert calculate_streak([], today=self.TODAY) == 0
+
+    def test_counts_consecutive_days_ending_today(self):
+        jobs = [
+            {"applied_at": "2026-03-10T09:00:00"},
+            {"applied_at": "2026-03-10T15:00:00"},
+            {"applied_at": "2026-03-09T12:00:00"},
+            {"applied_at": "2026-03-08T12:00:00"},
+            {"applied_at": "2026-03-05T12:00:00"},
+        ]
+        assert calculate_streak(jobs, today=self.TODAY) == 3
+
+    def test_streak_survives_until_end_of_next_day(self):
+        jobs = [{"applied_at": "2026-03-09T12:00:00"}, {"applied_at": "2026-03-08T12:00:00"}]
+        assert calculate_streak(jobs, today=self.TODAY) == 2
+
+    def test_broken_streak(self):
+        assert calculate_streak([{"applied_at": "2026-03-07T12:00:00"}], today=self.TODAY) == 0
+
+    def test_falls_back_to_created_at(self):
+        jobs = [{"applied_at": None, "created_at": "2026-03-10T08:00:00"}]
+        assert calculate_streak(jobs, today=self.TODAY) == 1
+
+
+class TestFetchActiveSearches:
+    def test_counts_active_configs_through_user_client(self):
+        with patch("app.routes.dashboard.supabase") as mock_sb:
+            chain = mock_sb.table.return_value.select.return_value.eq.return_value
+            chain.execute.return_value.data = [{"is_active": True}, {"is_active": False}, {"is_active": True}]
+            assert _fetch_active_searches("uid") == 2
+        mock_sb.table.assert_called_with("search_configs")
+        mock_sb.table.return_value.select.return_value.eq.assert_called_with("user_id", "uid")
+
+
+def _patched_reads(counts=None, week=0, scored=0, applied=(), recent=()):
+    """Patch every read _build_dashboard_context makes; returns the patchers."""
+    return (
+        patch("app.routes.dashboard.status_counts", return_value=Counter(counts or {})),
+        patch("app.routes.dashboard._fetch_week_count", return_value=week),
+        patch("app.routes.dashboard._fetch_scored_count", return_value=scored),
+        patch("app.routes.dashboard._fetch_applied_stamps", return_value=list(applied)),
+        patch("app.routes.dashboard._fetch_recent_applied", return_value=MagicMock(data=list(recent))),
+        patch("app.routes.dashboard._fetch_active_searches", return_value=1),
+        patch("app.routes.dashboard._fetch_cleanup_count", return_value=0),
+        patch("app.routes.dashboard._fetch_has_resume", return_value=True),
+    )
+
+
+class TestBuildDashboardContext:
+    @pytest.mark.asyncio
+    async def test_trims_recent_descriptions_before_caching(self):
+        recent = [
+            {"id": 1, "title": "Long", "description": "x" * 5000},
+            {"id": 2, "title": "Short", "description": "short text"},
+            {"id": 3, "title": "Pending", "description": None},
+        ]
+        with ExitStack() as stack:
+            for patcher in _patched_reads(recent=recent):
+                stack.enter_context(patcher)
+            context = await _build_dashboard_context({"id": "uid"})
+
+        descriptions = [job["description"] for job in context["recent_jobs"]]
+        assert descriptions == ["x" * (RECENT_DESCRIPTION_CHARS + 1), "short text", None]
+
+    @pytest.mark.asyncio
+    async def test_stats_come_from_server_side_counts(self):
+        # Far more jobs than PostgREST's max-rows: nothing is derived from a row list
+        counts = {"New": 2500, "Thinking": 10, "Applied": 12}
+        today = date.today().isoformat()
+        with ExitStack() as stack:
+            for patcher in _patched_reads(counts=counts, week=40, scored=7, applied=[{"applied_at": today}]):
+                stack.enter_context(patcher)
+            context = await _build_dashboard_context({"id": "uid"})
+
+        stats = context["stats"]
+        assert stats["total"] == 2522
+        assert stats["applied"] == 12 and stats["new"] == 2500
+        assert stats["week"] == 40
+        assert context["user_streak"] == 1
+        assert context["ai_paused"] is False
+
+    @pytest.mark.asyncio
+    async def test_ai_paused_when_nothing_is_scored(self):
+        with ExitStack() as stack:
+            for patcher in _patched_reads(counts={"New": 3}, scored=0):
+                stack.enter_context(patcher)
+            context = await _build_dashboard_context({"id": "uid"})
+        assert context["ai_paused"] is True
@@ -0,0 +1,117 @@
+from collections import Counter
+from unittest.mock import AsyncMock, patch
+
+from app.routes.jobs import PAGE_SIZE, board_count, page_count
+
+
+class TestBoardPaging:
+    COUNTS = Counter({"New": 120, "Thinking": 3, "Applied": 40})
+
+    def test_all_excludes_applied(self):
+        assert board_count(self.COUNTS) == 123
+        assert board_count(self.COUNTS, "all") == 123
+
+    def test_single_status(self):
+        assert board_count(self.COUNTS, "Thinking") == 3
+        assert board_count(self.COUNTS, "Ignored") == 0
+
+    def test_page_count_rounds_up_and_never_hits_zero(self):
+        assert page_count(0) == 1
+        assert page_count(PAGE_SIZE) == 1
+        assert page_count(PAGE_SIZE + 1) == 2
+
+
+class TestListJobs:
+    def test_renders_board_with_etag(self, auth_client):
+        with patch("app.routes.jobs.page_etag", AsyncMock(return_value='W/"abc"')), \
+             patch("app.routes.jobs.cache_get_json", AsyncMock(return_value=None)), \
+             patch("app.routes.jobs.cache_set_json", AsyncMock()), \
+             patch("app.routes.jobs.supabase") as mock_sb:
+            query = mock_sb.table.return_value.select.return_value.eq.return_value.or_.return_value
+            query.order.return_value = query
+            query.range.return_value.execute.return_value.data = [
+                {"id": 1, "title": "Rendered role", "company": "Acme", "status": "New", "match_score": None},
+            ]
+            mock_sb.rpc.return_value.execute.return_value.data = [{"status": "New", "n": 1}]
+            resp = auth_client.get("/job-board/")
+        assert resp.status_code == 200
+        assert "Rendered role" in resp.text
+        assert resp.headers["etag"] == 'W/"abc"'
+        assert resp.headers["cache-control"] == "private, no-cache"
+
+    def test_totals_are_tagged_for_in_place_updates(self, auth_client):
+        cached = {
+            "jobs": [{"id": 1, "title": "Role", "company": "Acme", "status": "New", "match_score": None}],
+            "counts": {"New": 120},
+        }
+        with patch("app.routes.jobs.page_etag", AsyncMock(return_value='W/"abc"')), \
+             patch("app.routes.jobs.cache_get_json", AsyncMock(return_value=cached)), \
+             patch("app.routes.jobs.supabase"):
+            resp = auth_client.get("/job-board/")
+        assert '<span id="to-review">120 roles</span>' in resp.text
+        assert f'data-page-size="{PAGE_SIZE}"' in resp.text
+        assert '<span id="page-count">3</span>' in resp.text
+        assert 'id="pager-next"' in resp.text
+
+    def test_query_failure_renders_error_page(self, auth_client):
+        with patch("app.routes.jobs.page_etag", AsyncMock(return_value=None)), \
+             patch("app.routes.jobs.supabase") as mock_sb:
+            mock_sb.rpc.return_value.execute.side_effect = RuntimeError("db down")
+            resp = auth_client.get("/job-board/")
+        assert resp.status_code == 200
+        assert "Error loading jobs: db down" in resp.text
+        assert "etag" not in resp.headers
+
+
+class TestUpdateStatus:
+    def test_form_post_redirects_back_to_board(self, auth_client):
+        with patch("app.routes.jobs.supabase"):
+            resp = auth_client.post("/job-board/7/update-status", data={"status": "Thinking"},
+                                    follow_redirects=False)
+        assert resp.status_code == 303
+        assert resp.headers["location"] == "/job-board"
+
+    def test_fetch_gets_json_instead_of_a_board_reload(self, auth_client):
+        with patch("app.routes.jobs.supabase") as mock_sb:
+            resp = auth_client.post("/job-board/7/update-status", data={"status": "Ignored"},
+                                    headers={"Accept": "application/json"}, follow_redirects=False)
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "Ignored"}
+        mock_sb.table.return_value.delete.return_value.eq.return_value.eq.return_value.execute.assert_called_once()
+
+
+class TestJobDetail:
+    def test_renders_full_description_for_owned_job(self, auth_client):
+        job = {"id": 7, "description": "Build APIs " * 20, "ai_summary": "Backend role",
+               "match_score": None, "created_at": "2026-01-02T00:00:00"}
+        with patch("app.routes.jobs.supabase") as mock_sb:
+            chain = mock_sb.table.return_value.select.return_value.eq.return_value.eq.return_value
+            chain.maybe_single.return_value.execute.return_value.data = job
+            resp = auth_client.get("/job-board/7/detail")
+        assert resp.status_code == 200
+        assert "Backend role" in resp.text
+        assert "Job description" in resp.text
+        mock_sb.table.return_value.select.return_value.eq.return_value.eq.assert_called_with("user_id", "test-user-uuid")
+
+    def test_404_when_job_missing(self, auth_client):
+        with patch("app.routes.jobs.supabase") as mock_sb:
+            chain = mock_sb.table.return_value.select.return_value.eq.return_value.eq.return_value
+            chain.maybe_single.return_value.execute.return_value = None
+            resp = auth_client.get("/job-board/7/detail")
+        assert resp.status_code == 404
+
+
+class TestBoardCache:
+    def test_cached_page_skips_supabase(self, auth_client):
+        cached = {
+            "jobs": [{"id": 1, "title": "Cached role", "company": "Acme", "status": "New", "match_score": None}],
+            "counts": {"New": 1},
+        }
+        with patch("app.routes.jobs.page_etag", AsyncMock(return_value='W/"abc"')), \
+             patch("app.routes.jobs.cache_get_json", AsyncMock(return_value=cached)) as mock_get, \
+             patch("app.routes.jobs.supabase") as mock_sb:
+            resp = auth_client.get("/job-board/?sort=date")
+        assert resp.status_code == 200
+        assert "Cached role" in resp.text
+        mock_get.assert_awaited_once_with('board:test-user-uuid:W/"abc"')
+        mock_sb.rpc.assert_not_called()
@@ -108,7 +108,7 @@ class TestRescoreAll:
         mock_update_chain = MagicMock()
 
         with patch("app.routes.resume.supabase") as mock_sb, \
-             patch("app.routes.resume.asyncio.to_thread", return_value={"score": 75, "reasoning": "Good match"}):
+             patch("app.utils.ai_client.score_job_match", return_value={"score": 75, "reasoning": "Good match"}) as mock_score:
             table_mock = mock_sb.table.return_value
             # profile select
             table_mock.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_profile
@@ -125,3 +125,4 @@ class TestRescoreAll:
         body = resp.json()
         assert body["total"] == 2
         assert body["scored"] == 2
+        assert mock_score.call_count == 2
@@ -0,0 +1,152 @@
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import scraper
+
+
+class TestStorageState:
+    def test_load_returns_none_when_unset_or_missing(self, tmp_path):
+        assert scraper._load_storage_state(None) is None
+        assert scraper._load_storage_state(str(tmp_path / "missing.json")) is None
+
+    def test_load_returns_none_for_corrupt_file(self, tmp_path):
+        path = tmp_path / "state.json"
+        path.write_text('{"cookies": [')
+        assert scraper._load_storage_state(str(path)) is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_leave_one_complete_file(self, tmp_path):
+        path = tmp_path / "state.json"
+        contexts = []
+        for n in range(4):
+            context = MagicMock()
+            context.storage_state = AsyncMock(return_value={"cookies": [{"name": f"c{n}"}], "origins": []})
+            contexts.append(context)
+
+        await asyncio.gather(*(scraper._save_storage_state(c, str(path)) for c in contexts))
+
+        saved = scraper._load_storage_state(str(path))
+        assert saved["cookies"][0]["name"] in {"c0", "c1", "c2", "c3"}
+        assert json.loads(path.read_text()) == saved
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+    def test_saves_keep_working_across_event_loops(self, tmp_path):
+        # /scrape-now runs the scraper on a fresh loop each time, in one process
+        path = str(tmp_path / "state.json")
+
+        async def save_twice(run):
+            contexts = []
+            for n in range(2):
+                context = MagicMock()
+                context.storage_state = AsyncMock(return_value={"cookies": [{"name": f"run{run}"}], "origins": []})
+                contexts.append(context)
+            await asyncio.gather(*(scraper._save_storage_state(c, path) for c in contexts))
+
+        asyncio.run(save_twice(1))
+        asyncio.run(save_twice(2))
+        assert scraper._load_storage_state(path)["cookies"][0]["name"] == "run2"
+
+
+class TestExtractSalary:
+    @pytest.mark.parametrize("text, expected", [
+        ("$80,000 - $120,000 per year", (80000, 120000, "USD")),
+        ("$80K - $120K per year", (80000, 120000, "USD")),
+        ("$80k-$95k", (80000, 95000, "USD")),
+        ("$90K - $150,000", (90000, 150000, "USD")),
+        ("$75,000/yr", (75000, 75000, "USD")),
+        ("$65K", (65000, 65000, "USD")),
+        ("80000 - 100000 EUR", (80000, 100000, None)),
+        ("$100K - $150K - $200K", (100000, 150000, "USD")),
+    ])
+    def test_amounts(self, text, expected):
+        assert scraper.extract_salary(text) == expected
+
+    @pytest.mark.parametrize("text, expected", [
+        (None, (None, None, None)),
+        ("", (None, None, None)),
+        ("Competitive", (None, None, None)),
+        ("$ Competitive", (None, None, "USD")),
+    ])
+    def test_no_amount(self, text, expected):
+        assert scraper.extract_salary(text) == expected
+
+
+class TestPostedDaysAgo:
+    @pytest.mark.parametrize("text, days", [
+        ("1 minute ago", 0),
+        ("45 minutes ago", 0),
+        ("1 hour ago", 0),
+        ("23 hours ago", 0),
+        ("1 day ago", 1),
+        ("3 days ago", 3),
+        ("30+ days ago", 30),
+        ("1 week ago", 7),
+        ("2 weeks ago", 14),
+        ("1 month ago", 30),
+        ("3 months ago", 90),
+        ("Reposted 2 Weeks Ago", 14),
+    ])
+    def test_units(self, text, days):
+        assert scraper._posted_days_ago(text) == days
+
+    @pytest.mark.parametrize("text", ["Just now", "ago", "3 years ago", "Actively recruiting"])
+    def test_unrecognised(self, text):
+        assert scraper._posted_days_ago(text) is None
+
+    def test_extract_posted_date_is_relative_to_now(self):
+        now = datetime(2026, 3, 31, 12, 0)
+        assert scraper.extract_posted_date("30+ days ago", now=now) == "2026-03-01T12:00:00"
+        assert scraper.extract_posted_date("", now=now) is None
+
+
+def _scraped(job_hash, title):
+    return {"title": title, "company": "Acme", "location": "Remote", "url": f"https://x/{job_hash}",
+            "job_hash": job_hash, "source": "linkedin"}
+
+
+class TestScrapeForUserWriter:
+    @pytest.mark.asyncio
+    async def test_upserts_unique_rows_and_counts_only_new_ones(self):
+        by_board = {
+            "linkedin": [_scraped(1, "A"), _scraped(2, "B"), _scraped(1, "A again")],
+            "greenhouse": [_scraped(2, "B elsewhere"), _scraped(3, "C")],
+        }
+        already_saved = {2}
+        upserts = []
+
+        def upsert(rows, **kwargs):
+            upserts.append((rows, kwargs))
+            # RETURNING with ignore_duplicates: only rows that were inserted
+            new = [dict(row, id=row["job_hash"]) for row in rows if row["job_hash"] not in already_saved]
+            query = MagicMock()
+            query.execute.return_value = MagicMock(data=new)
+            return query
+
+        config = {"keywords": "python", "location": "Remote", "pages": 1, "boards": ["linkedin", "greenhouse"]}
+        with patch("scraper._scrape_board", AsyncMock(side_effect=lambda board, *a: by_board[board])), \
+             patch("scraper.supabase") as mock_sb, \
+             patch("scraper.analyze_new_jobs", AsyncMock()) as mock_analyze:
+            mock_sb.table.return_value.upsert.side_effect = upsert
+            saved = await scraper.scrape_for_user("uid", config, browser=None)
+
+        assert saved == 2
+        sent_hashes = sorted(row["job_hash"] for rows, _ in upserts for row in rows)
+        assert sent_hashes == [1, 2, 3]
+        assert all(kwargs == {"on_conflict": "user_id,job_hash", "ignore_duplicates": True} for _, kwargs in upserts)
+        assert all(row["user_id"] == "uid" for rows, _ in upserts for row in rows)
+        new_rows = mock_analyze.await_args.args[1]
+        assert sorted(row["job_hash"] for row in new_rows) == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_nothing_found_skips_the_database(self):
+        config = {"keywords": "python", "location": "Remote", "pages": 1, "boards": ["linkedin"]}
+        with patch("scraper._scrape_board", AsyncMock(return_value=[])), \
+             patch("scraper.supabase") as mock_sb, \
+             patch("scraper.analyze_new_jobs", AsyncMock()) as mock_analyze:
+            assert await scraper.scrape_for_user("uid", config, browser=None) == 0
+        mock_sb.table.return_value.upsert.assert_not_called()
+        mock_analyze.assert_not_awaited()
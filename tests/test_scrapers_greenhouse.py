@@ -71,3 +71,23 @@ class TestGreenhouseScrapeCompany:
             from scrapers.greenhouse import scrape_company
             jobs = await scrape_company("acme", "Data Analyst")
         assert jobs[0]["work_type"] == "Remote"
+
+
+class TestGreenhouseScrape:
+    @pytest.mark.asyncio
+    async def test_sweeps_every_company_and_skips_failures(self, monkeypatch):
+        import scrapers.greenhouse as greenhouse
+        monkeypatch.setattr(greenhouse, "COMPANY_SLUGS", ["acme", "nope"])
+        payload = {"jobs": [
+            {"title": "Engineer", "location": {"name": "NY"},
+             "absolute_url": "https://boards.greenhouse.io/acme/jobs/1", "content": "x"},
+        ]}
+        with respx.mock:
+            respx.get("https://boards-api.greenhouse.io/v1/boards/acme/jobs").mock(
+                return_value=httpx.Response(200, json=payload)
+            )
+            respx.get("https://boards-api.greenhouse.io/v1/boards/nope/jobs").mock(
+                return_value=httpx.Response(404)
+            )
+            jobs = await greenhouse.scrape("Engineer")
+        assert [j["company"] for j in jobs] == ["Acme"]
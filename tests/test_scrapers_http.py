@@ -0,0 +1,70 @@
+import hashlib
+
+import pytest
+import respx
+import httpx
+from unittest.mock import AsyncMock, patch
+
+from scrapers import RateLimiter, get_with_backoff, job_hash
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_spaces_back_to_back_calls(self):
+        limiter = RateLimiter(2.0)
+        with patch("scrapers.time.monotonic", return_value=100.0), \
+             patch("scrapers.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await limiter.wait()
+            await limiter.wait()
+            await limiter.wait()
+        assert [c.args[0] for c in sleep.await_args_list] == [2.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_no_sleep_once_interval_has_passed(self):
+        limiter = RateLimiter(1.0)
+        with patch("scrapers.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            with patch("scrapers.time.monotonic", return_value=10.0):
+                await limiter.wait()
+            with patch("scrapers.time.monotonic", return_value=15.0):
+                await limiter.wait()
+        sleep.assert_not_awaited()
+
+
+class TestGetWithBackoff:
+    @pytest.mark.asyncio
+    async def test_retries_429_honouring_retry_after(self):
+        limiter = RateLimiter(0)
+        with respx.mock, patch("scrapers.asyncio.sleep", new_callable=AsyncMock):
+            route = respx.get("https://example.com/x").mock(side_effect=[
+                httpx.Response(429, headers={"Retry-After": "7"}),
+                httpx.Response(200, text="ok"),
+            ])
+            with patch.object(limiter, "defer") as defer:
+                async with httpx.AsyncClient() as client:
+                    resp = await get_with_backoff(client, "https://example.com/x", limiter)
+        assert resp.status_code == 200
+        assert route.call_count == 2
+        defer.assert_called_once_with(7.0)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_attempts(self):
+        limiter = RateLimiter(0)
+        with respx.mock, patch("scrapers.asyncio.sleep", new_callable=AsyncMock):
+            route = respx.get("https://example.com/x").mock(return_value=httpx.Response(503))
+            async with httpx.AsyncClient() as client:
+                resp = await get_with_backoff(client, "https://example.com/x", limiter, attempts=3)
+        assert resp.status_code == 503
+        assert route.call_count == 3
+
+
+class TestJobHash:
+    def test_is_case_insensitive_and_fits_bigint(self):
+        h = job_hash("Backend Engineer", "Stripe", "Remote")
+        assert h == job_hash("backend engineer", "STRIPE", "remote")
+        assert -(2 ** 63) <= h < 2 ** 63
+
+    def test_matches_postgres_md5_prefix(self):
+        # Same value as ('x' || left(md5(...), 16))::bit(64)::bigint
+        prefix = int(hashlib.md5(b"a_b_none").hexdigest()[:16], 16)
+        expected = prefix - 2 ** 64 if prefix >= 2 ** 63 else prefix
+        assert job_hash("A", "b", None) == expected
@@ -56,3 +56,23 @@ class TestLeverScrapeCompany:
             )
             from scrapers.lever import scrape_company
             assert await scrape_company("acme", "Engineer") == []
+
+
+class TestLeverScrape:
+    @pytest.mark.asyncio
+    async def test_sweeps_every_company_and_skips_failures(self, monkeypatch):
+        import scrapers.lever as lever
+        monkeypatch.setattr(lever, "COMPANY_SLUGS", ["acme", "nope"])
+        payload = [
+            {"text": "Engineer", "categories": {"location": "NY"},
+             "hostedUrl": "https://jobs.lever.co/acme/abc", "descriptionPlain": "x"},
+        ]
+        with respx.mock:
+            respx.get("https://api.lever.co/v0/postings/acme").mock(
+                return_value=httpx.Response(200, json=payload)
+            )
+            respx.get("https://api.lever.co/v0/postings/nope").mock(
+                return_value=httpx.Response(500)
+            )
+            jobs = await lever.scrape("Engineer")
+        assert [j["company"] for j in jobs] == ["Acme"]
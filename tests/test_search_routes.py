@@ -0,0 +1,46 @@
+from unittest.mock import AsyncMock, patch
+
+from app.routes.search import _CONFIG_COLUMNS
+
+
+def _configs_chain(mock_sb):
+    return mock_sb.table.return_value.select.return_value.eq.return_value
+
+
+class TestListSearches:
+    def test_lists_configs_through_user_client(self, auth_client):
+        with patch("app.routes.search.supabase") as mock_sb:
+            _configs_chain(mock_sb).execute.return_value.data = [
+                {"id": 1, "keywords": "Platform engineer", "location": "Remote", "is_active": True},
+            ]
+            resp = auth_client.get("/search/")
+        assert resp.status_code == 200
+        assert "Platform engineer" in resp.text
+        mock_sb.table.assert_called_with("search_configs")
+        mock_sb.table.return_value.select.assert_called_with(_CONFIG_COLUMNS)
+        mock_sb.table.return_value.select.return_value.eq.assert_called_with("user_id", "test-user-uuid")
+
+    def test_etag_is_sent_with_the_loaded_configs(self, auth_client):
+        with patch("app.routes.search.page_etag", AsyncMock(return_value='W/"v1"')), \
+             patch("app.routes.search.supabase") as mock_sb:
+            _configs_chain(mock_sb).execute.return_value.data = [
+                {"id": 1, "keywords": "Data engineer", "location": "Berlin", "is_active": True},
+            ]
+            resp = auth_client.get("/search/")
+        assert resp.status_code == 200
+        assert resp.headers["etag"] == 'W/"v1"'
+        assert "Data engineer" in resp.text
+
+    def test_no_etag_on_error_page(self, auth_client):
+        with patch("app.routes.search.page_etag", AsyncMock(return_value='W/"v1"')), \
+             patch("app.routes.search.supabase") as mock_sb:
+            _configs_chain(mock_sb).execute.side_effect = RuntimeError("boom")
+            resp = auth_client.get("/search/")
+        assert "etag" not in resp.headers
+
+    def test_matching_etag_skips_supabase(self, auth_client):
+        with patch("app.routes.search.page_etag", AsyncMock(return_value='W/"v1"')), \
+             patch("app.routes.search.supabase") as mock_sb:
+            resp = auth_client.get("/search/", headers={"If-None-Match": 'W/"v1"'})
+        assert resp.status_code == 304
+        mock_sb.table.assert_not_called()
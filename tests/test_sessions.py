@@ -0,0 +1,73 @@
+from unittest.mock import AsyncMock
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.sessions import SESSION_TTL_SEC, RedisSessionMiddleware
+
+
+def _make_client(redis):
+    async def login(request):
+        request.session["user"] = {"id": "uid-1"}
+        return JSONResponse({"ok": True})
+
+    async def me(request):
+        return JSONResponse({"user": request.session.get("user")})
+
+    async def logout(request):
+        request.session.clear()
+        return JSONResponse({"ok": True})
+
+    app = Starlette(routes=[Route("/login", login), Route("/me", me), Route("/logout", logout)])
+    app.add_middleware(RedisSessionMiddleware, redis=redis)
+    return TestClient(app)
+
+
+class TestRedisSessionMiddleware:
+    def test_anonymous_request_sets_no_cookie(self, fake_redis):
+        redis = fake_redis
+        client = _make_client(redis)
+        resp = client.get("/me")
+        assert resp.json() == {"user": None}
+        assert "set-cookie" not in resp.headers
+        assert redis.store == {}
+
+    def test_session_round_trips_through_redis(self, fake_redis):
+        redis = fake_redis
+        client = _make_client(redis)
+        client.get("/login")
+
+        sid = client.cookies.get("sid")
+        assert sid and f"sess:{sid}" in redis.store
+        assert client.get("/me").json() == {"user": {"id": "uid-1"}}
+
+    def test_unchanged_session_is_not_rewritten(self, fake_redis):
+        redis = fake_redis
+        client = _make_client(redis)
+        client.get("/login")
+        redis.set = AsyncMock(side_effect=redis.set)
+        client.get("/me")
+        redis.set.assert_not_awaited()
+
+    def test_reading_session_slides_its_expiry(self, fake_redis):
+        redis = fake_redis
+        client = _make_client(redis)
+        client.get("/login")
+        sid = client.cookies.get("sid")
+        redis.ttls[f"sess:{sid}"] = 60  # nearly expired
+
+        resp = client.get("/me")
+
+        assert redis.ttls[f"sess:{sid}"] == SESSION_TTL_SEC
+        assert f"sid={sid}" in resp.headers["set-cookie"]
+        assert f"Max-Age={SESSION_TTL_SEC}" in resp.headers["set-cookie"]
+
+    def test_logout_deletes_server_side_session(self, fake_redis):
+        redis = fake_redis
+        client = _make_client(redis)
+        client.get("/login")
+        client.get("/logout")
+        assert redis.store == {}
+        assert client.get("/me").json() == {"user": None}